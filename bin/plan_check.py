@@ -7,6 +7,17 @@ todo_p = ROOT/".plan"/"TODO.md"
 man_p  = ROOT/".plan"/"tasks.manifest.json"
 st_p   = ROOT/".plan"/"state.json"
 
+# UTF-8 encoding of the mojibake marker 'â†’' (a double-encoded '→').
+_MOJIBAKE = "â†’".encode("utf-8")
+
+# '## Section' headings and '- {TASK-ID} Summary' bullets, scanned in one pass.
+# Surrounding whitespace is excluded by the pattern, so groups need no stripping.
+_TODO_BULLET_RE = re.compile(
+    r"(?m)^(?:## [^\S\n]*(?P<section>.*?)"
+    r"|[ \t]*-[ \t]*\{[^\S\n]*(?P<id>[^}\s][^}\n]*?)[^\S\n]*\}[ \t]*(?P<summary>.*?))"
+    r"[^\S\n]*$"
+)
+
 def die(msg):
     """Print an error message and exit with failure."""
     print(f"PLAN CHECK ✖ {msg}", file=sys.stderr)
@@ -17,31 +28,39 @@ def ok(msg):
     """Print a success message for informational checks."""
     print(f"PLAN CHECK ✓ {msg}")
 
-# --- read files
-try:
-    todo = todo_p.read_text(encoding="utf-8")
-    man_raw = man_p.read_text(encoding="utf-8")
-    man  = json.loads(man_raw)
-    st   = json.loads(st_p.read_text(encoding="utf-8"))
-except Exception as e:
-    die(f"failed to read plan files: {e}")
 
-# --- UTF-8 sanity (simple mojibake marker)
-if "â†’" in todo or "â†’" in man_raw:
-    die("UTF-8 mojibake detected (e.g., 'â†’'). Fix arrows like 'READ→VERIFY'.")
+def _load_plan_files():
+    """Read each plan file exactly once and return ``(todo, man, st)``."""
+    try:
+        todo_b = todo_p.read_bytes()
+        man_b  = man_p.read_bytes()
+        st_b   = st_p.read_bytes()
+    except Exception as e:
+        die(f"failed to read plan files: {e}")
+
+    # --- UTF-8 sanity (simple mojibake marker), checked before decoding
+    if _MOJIBAKE in todo_b or _MOJIBAKE in man_b:
+        die("UTF-8 mojibake detected (e.g., 'â†’'). Fix arrows like 'READ→VERIFY'.")
+
+    try:
+        todo = todo_b.decode("utf-8")
+        man  = json.loads(man_b)
+        st   = json.loads(st_b)
+    except Exception as e:
+        die(f"failed to read plan files: {e}")
+    return todo, man, st
+
+# --- read files
+todo, man, st = _load_plan_files()
 
 # --- IDs from TODO lists like '- {TASK-ID} Summary'
 todo_items = []
 section = None
-pat = re.compile(r"^-\s*\{([^}]+)\}\s*(.*)$")
-for line in todo.splitlines():
-    if line.startswith("## "):
-        section = line[3:].strip()
-        continue
-    m = pat.match(line.strip())
-    if not m:
+for m in _TODO_BULLET_RE.finditer(todo):
+    if m["section"] is not None:
+        section = m["section"]
         continue
-    tid = m.group(1).strip()
+    tid = m["id"]
     if tid.lower() == "none":
         continue
     todo_items.append((tid, section))
@@ -61,14 +80,17 @@ except Exception:
 state_ids = set(st.get("tasks", {}).keys())
 
 # --- ID set checks
-missing_in_state  = todo_ids - state_ids
-missing_in_man    = todo_ids - man_ids
-extra_in_state    = state_ids - todo_ids  # tolerated, but warn
+def die_if_missing(ids, known, where):
+    """Exit listing every ID absent from ``known``; builds no set when none are."""
+    missing = (tid for tid in ids if tid not in known)
+    first = next(missing, None)
+    if first is not None:
+        die(f"IDs in TODO missing in {where}: {sorted({first, *missing})}")
+
+die_if_missing(todo_ids, state_ids, "state.json")
+die_if_missing(todo_ids, man_ids, "tasks.manifest.json")
 
-if missing_in_state:
-    die(f"IDs in TODO missing in state.json: {sorted(missing_in_state)}")
-if missing_in_man:
-    die(f"IDs in TODO missing in tasks.manifest.json: {sorted(missing_in_man)}")
+extra_in_state    = state_ids - todo_ids  # tolerated, but warn
 
 if extra_in_state:
     ok(f"note: extra IDs in state.json (not in TODO): {sorted(extra_in_state)}")
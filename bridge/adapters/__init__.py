@@ -1,6 +1,7 @@
 """Architecture adapter interfaces and registry helpers."""
 from __future__ import annotations
 from importlib import import_module
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Dict, Mapping, Protocol
 
 if TYPE_CHECKING:  # pragma: no cover - import only used for typing
@@ -28,28 +29,35 @@ _OPTIONAL_ADAPTERS: Dict[str, str] = {
     "x86": "bridge.adapters.x86:X86Adapter",
     "i386": "bridge.adapters.x86:X86Adapter",
 }
+# Pre-split "module:attr" specs so loading an adapter does not re-parse them.
+_OPTIONAL_ADAPTER_TARGETS: Dict[str, tuple[str, str]] = {
+    key: tuple(spec.split(":", 1)) for key, spec in _OPTIONAL_ADAPTERS.items()
+}
+_OPTIONAL_ADAPTERS_VIEW: Mapping[str, str] = MappingProxyType(_OPTIONAL_ADAPTERS)
 
 
 def optional_adapter_names() -> Mapping[str, str]:
-    """Return a mapping of optional adapter names to their import paths."""
+    """Return a read-only mapping of optional adapter names to their import paths."""
 
-    return dict(_OPTIONAL_ADAPTERS)
+    return _OPTIONAL_ADAPTERS_VIEW
 
 
 def load_optional_adapter(name: str) -> ArchAdapter:
-    """Instantiate an optional adapter by name without eager imports."""
+    """Return the shared instance of an optional adapter without eager imports."""
 
     key = name.lower()
     try:
-        module_spec = _OPTIONAL_ADAPTERS[key]
+        module_name, attr = _OPTIONAL_ADAPTER_TARGETS[key]
     except KeyError as exc:  # pragma: no cover - defensive branch
         available = ", ".join(sorted(_OPTIONAL_ADAPTERS)) or "<none>"
         raise ValueError(
             f"Unknown optional adapter '{name}'. Available adapters: {available}."
         ) from exc
-    module_name, attr = module_spec.split(":", 1)
     module = import_module(module_name)
     adapter_cls = getattr(module, attr)
+    default = getattr(module, "DEFAULT", None)
+    if isinstance(default, adapter_cls):
+        return default
     return adapter_cls()
 
 
@@ -6,10 +6,10 @@ from typing import Any
 
 from . import ArchAdapter, Probe
 
-BX_SENTINELS = {0xE12FFF1C, 0xE12FFF33}
+BX_SENTINELS = frozenset({0xE12FFF1C, 0xE12FFF33})
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ARMThumbAdapter(ArchAdapter):
     code_alignment: int = 4
 
@@ -55,4 +55,7 @@ class ARMThumbAdapter(ArchAdapter):
         return True
 
 
-__all__ = ["ARMThumbAdapter"]
+# Adapters are frozen, so every caller can share one instance.
+DEFAULT = ARMThumbAdapter()
+
+__all__ = ["ARMThumbAdapter", "DEFAULT"]
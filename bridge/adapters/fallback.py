@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from . import ArchAdapter, Probe
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class FallbackAdapter(ArchAdapter):
     def in_code_range(self, ptr: int, code_min: int, code_max: int) -> bool:
         return code_min <= ptr < code_max
@@ -20,4 +20,7 @@ class FallbackAdapter(ArchAdapter):
         return None, None
 
 
-__all__ = ["FallbackAdapter"]
+# Adapters are frozen, so every caller can share one instance.
+DEFAULT = FallbackAdapter()
+
+__all__ = ["FallbackAdapter", "DEFAULT"]
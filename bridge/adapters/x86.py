@@ -7,7 +7,7 @@ from typing import Any
 from . import ArchAdapter, Probe
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class X86Adapter(ArchAdapter):
     """Minimal x86 adapter that mirrors the ARM baseline contract."""
 
@@ -37,4 +37,7 @@ class X86Adapter(ArchAdapter):
         return None, None
 
 
-__all__ = ["X86Adapter"]
+# Adapters are frozen, so every caller can share one instance.
+DEFAULT = X86Adapter()
+
+__all__ = ["X86Adapter", "DEFAULT"]
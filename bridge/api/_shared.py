@@ -3,56 +3,117 @@ from __future__ import annotations
 
 import inspect
 import os
-from functools import wraps
-from typing import Callable, Dict
-
-from starlette.responses import JSONResponse
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Callable, Dict, Mapping
 
 from ..adapters import ArchAdapter, load_optional_adapter, optional_adapter_names
-from ..adapters.arm_thumb import ARMThumbAdapter
-from ..adapters.fallback import FallbackAdapter
+from ..adapters.arm_thumb import DEFAULT as ARM_THUMB_ADAPTER
+from ..adapters.fallback import DEFAULT as FALLBACK_ADAPTER
 from ..ghidra.client import GhidraClient
-from ..utils.errors import ErrorCode, make_error
+from ..utils import jsoncodec
+from ..utils.errors import CODE_TO_STATUS, ErrorCode, make_error
+
+if TYPE_CHECKING:  # pragma: no cover - import only used for typing
+    from starlette.responses import JSONResponse, Response
+
+
+@lru_cache(maxsize=1)
+def _json_response_cls() -> type["JSONResponse"]:
+    """Return the JSON response class, resolved on first use.
+
+    Responses are rendered with ``orjson`` when it is installed and fall back to
+    Starlette's stdlib ``json`` renderer otherwise.
+    """
+
+    from starlette.responses import JSONResponse
+
+    if not jsoncodec.HAS_ORJSON:  # pragma: no cover - orjson is an optional speedup
+        return JSONResponse
+
+    class ORJSONResponse(JSONResponse):
+        def render(self, content: object) -> bytes:
+            return jsoncodec.dumps(content)
+
+    return ORJSONResponse
+
+
+def json_response(
+    content: object,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> JSONResponse:
+    """Build a JSON response for payloads that are not envelopes."""
+
+    return _json_response_cls()(content, status_code=status_code, headers=headers)
 
 
 def envelope_ok(data: Dict[str, object]) -> Dict[str, object]:
     return {"ok": True, "data": data, "errors": []}
 
 
-def envelope_error(
+def _error_envelope(
     code: ErrorCode,
-    message: str | None = None,
+    message: str | None,
     *,
-    recovery: tuple[str, ...] | None = None,
-    status: int | None = None,
-    upstream_error: dict | None = None,
-) -> Dict[str, object]:
+    recovery: tuple[str, ...] | None,
+    status: int | None,
+    upstream_error: dict | None,
+) -> tuple[Dict[str, object], int]:
+    """Build an error envelope together with its resolved HTTP status."""
+
+    resolved_status = status if status is not None else CODE_TO_STATUS.get(code, 500)
     error_payload = make_error(
         code,
         message=message,
         recovery=recovery,
-        status=status,
+        status=resolved_status,
     )
     if upstream_error is not None:
-        error_payload = dict(error_payload)
         error_payload["upstream"] = upstream_error
-    return {
+    envelope = {
         "ok": False,
         "data": None,
         "errors": [error_payload],
     }
+    return envelope, int(resolved_status)
+
+
+def envelope_error(
+    code: ErrorCode,
+    message: str | None = None,
+    *,
+    recovery: tuple[str, ...] | None = None,
+    status: int | None = None,
+    upstream_error: dict | None = None,
+) -> Dict[str, object]:
+    envelope, _ = _error_envelope(
+        code,
+        message,
+        recovery=recovery,
+        status=status,
+        upstream_error=upstream_error,
+    )
+    return envelope
+
 
+def _envelope_status(payload: Dict[str, object]) -> int:
+    if payload.get("ok"):
+        return 200
+    errors = payload.get("errors")
+    if isinstance(errors, list) and errors:
+        return int(errors[0].get("status", 500))
+    return 500
 
-def envelope_response(payload: Dict[str, object]) -> JSONResponse:
-    status = 200
-    if not payload.get("ok"):
-        errors = payload.get("errors")
-        if isinstance(errors, list) and errors:
-            first = errors[0]
-            status = int(first.get("status", 500))
-        else:
-            status = 500
-    return JSONResponse(payload, status_code=status)
+
+def envelope_response(
+    payload: Dict[str, object], *, status: int | None = None
+) -> JSONResponse:
+    """Wrap ``payload`` in a response; pass ``status`` when it is already known."""
+
+    if status is None:
+        status = _envelope_status(payload)
+    return _json_response_cls()(payload, status_code=status)
 
 
 def error_response(
@@ -63,34 +124,84 @@ def error_response(
     upstream_error: dict | None = None,
     status: int | None = None,
 ) -> JSONResponse:
-    return envelope_response(
-        envelope_error(
-            code,
-            message,
-            recovery=recovery,
-            upstream_error=upstream_error,
-            status=status,
-        )
+    envelope, resolved_status = _error_envelope(
+        code,
+        message,
+        recovery=recovery,
+        status=status,
+        upstream_error=upstream_error,
+    )
+    return envelope_response(envelope, status=resolved_status)
+
+
+@lru_cache(maxsize=64)
+def _static_error_body(
+    code: ErrorCode, message: str | None, recovery: tuple[str, ...] | None
+) -> tuple[bytes, int]:
+    envelope, status = _error_envelope(
+        code, message, recovery=recovery, status=None, upstream_error=None
+    )
+    return jsoncodec.dumps(envelope), status
+
+
+def static_error_response(
+    code: ErrorCode, message: str | None, *, recovery: tuple[str, ...] | None = None
+) -> Response:
+    """Return an error response for a fixed message, serialised only once."""
+
+    from starlette.responses import Response
+
+    body, status = _static_error_body(code, message, recovery)
+    return Response(body, status_code=status, media_type="application/json")
+
+
+def upstream_error_response(
+    code: ErrorCode,
+    message: str | None,
+    *,
+    upstream_error: dict | None,
+    recovery: tuple[str, ...] | None = None,
+    status: int | None = None,
+) -> Response:
+    """Report a failed upstream call, reusing cached bytes when there is no detail."""
+
+    if upstream_error is None and status is None:
+        return static_error_response(code, message, recovery=recovery)
+    return error_response(
+        code,
+        message,
+        recovery=recovery,
+        upstream_error=upstream_error,
+        status=status,
+    )
+
+
+_ARM_ALIASES = frozenset({"arm", "auto", "thumb"})
+_OPTIONAL_REGISTRY = frozenset(optional_adapter_names())
+
+
+@lru_cache(maxsize=8)
+def _enabled_optional(raw: str) -> frozenset[str]:
+    """Parse ``BRIDGE_OPTIONAL_ADAPTERS`` once per distinct value."""
+
+    return frozenset(
+        item.strip().lower()
+        for item in raw.split(",")
+        if item.strip()
     )
 
 
 def adapter_for_arch(arch: str) -> ArchAdapter:
     normalized = arch.lower()
-    if normalized in {"arm", "auto", "thumb"}:
-        return ARMThumbAdapter()
+    if normalized in _ARM_ALIASES:
+        return ARM_THUMB_ADAPTER
 
     enabled = os.getenv("BRIDGE_OPTIONAL_ADAPTERS", "")
     if enabled:
-        requested = {
-            item.strip().lower()
-            for item in enabled.split(",")
-            if item.strip()
-        }
-        registry = optional_adapter_names()
-        if normalized in requested and normalized in registry:
+        if normalized in _enabled_optional(enabled) and normalized in _OPTIONAL_REGISTRY:
             return load_optional_adapter(normalized)
 
-    return FallbackAdapter()
+    return FALLBACK_ADAPTER
 
 
 def inject_client(factory: Callable[[], GhidraClient]):
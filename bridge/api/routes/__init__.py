@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from itertools import chain
 from typing import Callable, Iterable, List
 
 from starlette.routing import Route
@@ -23,12 +24,13 @@ from .mmio_routes import create_mmio_routes
 from .project_routes import create_project_routes
 from .search_routes import create_search_routes
 
+logger = logging.getLogger("bridge.api")
+
 
 def make_routes(
     client_factory: Callable[[], GhidraClient], *, enable_writes: bool = ENABLE_WRITES,
     call_semaphore: asyncio.Semaphore | None = None,
 ) -> List[Route]:
-    logger = logging.getLogger("bridge.api")
     semaphore = call_semaphore or asyncio.Semaphore(1)
 
     with_client = build_with_client(
@@ -57,10 +59,7 @@ def make_routes(
         create_datatype_routes(deps),
     )
 
-    routes: List[Route] = []
-    for group in groups:
-        routes.extend(group)
-    return routes
+    return list(chain.from_iterable(groups))
 
 
 __all__ = ["make_routes", "adapter_for_arch"]
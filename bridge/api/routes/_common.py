@@ -11,6 +11,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from ...ghidra.client import GhidraClient
+from ...utils import jsoncodec
 from ...utils.errors import ErrorCode
 from ...utils.program_context import PROGRAM_SELECTIONS, requestor_from_request
 from ..validators import validate_payload
@@ -33,7 +34,7 @@ class RouteDependencies:
 
 async def validated_json_body(request: Request, schema: str) -> Dict[str, object]:
     try:
-        data = await request.json()
+        data = jsoncodec.loads(await request.body())
     except json.JSONDecodeError as exc:
         # Re-raise to let the central error handler catch it
         raise
@@ -48,6 +49,19 @@ async def validated_json_body(request: Request, schema: str) -> Dict[str, object
     return data
 
 
+# Requests to these paths do not count as using the selected program.
+_SELECTION_EXEMPT_PATHS = frozenset(
+    {
+        "/api/current_program.json",
+        "/api/select_program.json",
+        "/api/capabilities.json",
+        "/api/health.json",
+        "/openapi.json",
+        "/state",
+    }
+)
+
+
 def build_with_client(
     factory: Callable[[], GhidraClient], *, enable_writes: bool, call_semaphore: asyncio.Semaphore
 ) -> RouteDecorator:
@@ -55,17 +69,12 @@ def build_with_client(
         @wraps(func)
         async def wrapper(request: Request) -> JSONResponse:
             request.state.enable_writes = enable_writes
-            requestor = requestor_from_request(request)
-            request.state.program_requestor = requestor
-            skip_paths = {
-                "/api/current_program.json",
-                "/api/select_program.json",
-                "/api/capabilities.json",
-                "/api/health.json",
-                "/openapi.json",
-                "/state",
-            }
-            if request.url.path not in skip_paths:
+            if request.scope["path"] in _SELECTION_EXEMPT_PATHS:
+                # Program routes resolve the requestor themselves when needed.
+                request.state.program_requestor = None
+            else:
+                requestor = requestor_from_request(request)
+                request.state.program_requestor = requestor
                 PROGRAM_SELECTIONS.mark_used(requestor)
             client = factory()
             try:
@@ -0,0 +1,53 @@
+"""Router with constant-time dispatch for literal HTTP paths."""
+from __future__ import annotations
+
+from operator import is_not
+from typing import Any, Dict, List
+
+from starlette.routing import BaseRoute, Match, Route, Router
+from starlette.types import Receive, Scope, Send
+
+
+class LiteralRouter(Router):
+    """Resolve parameter-free HTTP routes with a dict lookup.
+
+    Starlette's router tries every route's regex in order. All bridge API
+    paths are literals, so the leading run of parameter-free :class:`Route`
+    entries is indexed by path. Anything the index cannot settle on its own
+    (405s, mounts, redirects, ``root_path`` deployments) goes through the
+    regular ordered scan, so matching semantics are unchanged.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._index: Dict[str, List[Route]] = {}
+        self._indexed_routes: List[BaseRoute] = []
+
+    def _literal_index(self) -> Dict[str, List[Route]]:
+        # Routes can be appended or replaced after construction, so rebuild
+        # unless every entry is still the very object that was indexed. An
+        # unchanged table costs one pointer compare per route.
+        routes, indexed = self.routes, self._indexed_routes
+        if len(routes) != len(indexed) or any(map(is_not, routes, indexed)):
+            index: Dict[str, List[Route]] = {}
+            for route in self.routes:
+                if not isinstance(route, Route) or route.param_convertors:
+                    break
+                index.setdefault(route.path, []).append(route)
+            self._index = index
+            self._indexed_routes = list(self.routes)
+        return self._index
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not scope.get("root_path"):
+            for route in self._literal_index().get(scope["path"], ()):
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    scope.setdefault("router", self)
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+        await super().app(scope, receive, send)
+
+
+__all__ = ["LiteralRouter"]
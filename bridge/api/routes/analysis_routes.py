@@ -12,7 +12,7 @@ from ...utils.errors import ErrorCode
 from ...utils.hex import parse_hex
 from ...utils.logging import SafetyLimitExceeded, request_scope
 from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -28,7 +28,7 @@ def create_analysis_routes(deps: RouteDependencies) -> List[Route]:
                 request, "analyze_function_complete.request.v1.json"
             )
             try:
-                address = parse_hex(str(data["address"]))
+                address = parse_hex(data["address"])
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
 
@@ -43,7 +43,7 @@ def create_analysis_routes(deps: RouteDependencies) -> List[Route]:
                     client,
                     address=address,
                     fields=fields,
-                    fmt=str(data.get("fmt", "json")),
+                    fmt=data.get("fmt", "json"),
                     max_result_tokens=(
                         int(data["max_result_tokens"])
                         if "max_result_tokens" in data
@@ -56,7 +56,7 @@ def create_analysis_routes(deps: RouteDependencies) -> List[Route]:
             except ValueError as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
 
-            valid, errors = validate_payload(
+            valid, errors = validate_response(
                 "analyze_function_complete.v1.json", payload
             )
             if valid:
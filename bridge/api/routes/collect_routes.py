@@ -1,20 +1,93 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Mapping, Sequence
+import asyncio
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple, Union
+from urllib.parse import urlsplit
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
 from ...features.collect import execute_collect
 from ...ghidra.client import GhidraClient
 from ...utils.errors import ErrorCode
 from ...utils.logging import SafetyLimitExceeded, request_scope
-from .._shared import envelope_error, envelope_ok, envelope_response
-from ..validators import validate_payload
+from .._shared import (
+    envelope_error,
+    envelope_ok,
+    envelope_response,
+    static_error_response,
+)
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
+def _object_list(
+    raw: object, message: str
+) -> Tuple[List[Mapping[str, Any]] | None, Response | None]:
+    """Return *raw* as a list of objects, or an error response using *message*."""
+
+    if raw is None:
+        return [], None
+    # Bodies come straight from the JSON decoder, so objects are always plain
+    # ``dict`` instances and an exact type check avoids the ABC lookup.
+    if type(raw) is list and all(type(item) is dict for item in raw):
+        return raw, None
+    return None, static_error_response(ErrorCode.INVALID_REQUEST, message)
+
+
+_ProjectOutcome = Union[Mapping[str, Any], SafetyLimitExceeded, KeyError, TypeError, ValueError]
+
+
+class _ProjectPlan(NamedTuple):
+    entry: Mapping[str, Any]
+    project_id: str
+    queries: List[Mapping[str, Any]]
+    url: str | None
+
+    def backend(self, client: GhidraClient) -> str | None:
+        if self.url is None:
+            return getattr(client, "base_url", None)
+        return self.url if self.url.endswith("/") else f"{self.url}/"
+
+
+def _backend_key(url: str | None) -> str | None:
+    """Return a key under which spellings of the same Ghidra URL compare equal."""
+
+    if url is None:
+        return None
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def _run_project(
+    deps: RouteDependencies, client: GhidraClient, plan: _ProjectPlan
+) -> _ProjectOutcome:
+    """Run one project's queries, returning the payload or the raised error."""
+
+    project_client = client
+    if plan.url is not None:
+        project_client = deps.client_factory()
+        if hasattr(project_client, "base_url"):
+            try:
+                project_client.base_url = plan.backend(client)
+            except AttributeError:
+                pass
+
+    budget = plan.entry.get("result_budget")
+    try:
+        return execute_collect(
+            project_client,
+            plan.queries,
+            result_budget=budget if isinstance(budget, Mapping) else None,
+        )
+    except (SafetyLimitExceeded, KeyError, TypeError, ValueError) as exc:
+        return exc
+    finally:
+        if project_client is not client:
+            project_client.close()
+
+
 def create_collect_routes(deps: RouteDependencies) -> List[Route]:
     @deps.with_client
     async def collect_route(request: Request, client: GhidraClient) -> JSONResponse:
@@ -30,21 +103,11 @@ def create_collect_routes(deps: RouteDependencies) -> List[Route]:
             except ValueError as exc:
                 return envelope_response(envelope_error(ErrorCode.INVALID_REQUEST, str(exc)))
 
-            queries_raw = data.get("queries")
-            queries: Sequence[Mapping[str, object]]
-            if queries_raw is None:
-                queries = []
-            else:
-                if not isinstance(queries_raw, list) or any(
-                    not isinstance(item, Mapping) for item in queries_raw
-                ):
-                    return envelope_response(
-                        envelope_error(
-                            ErrorCode.INVALID_REQUEST,
-                            "queries must be an array of objects",
-                        )
-                    )
-                queries = queries_raw
+            queries, error = _object_list(
+                data.get("queries"), "queries must be an array of objects"
+            )
+            if error is not None:
+                return error
 
             result_budget = data.get("result_budget")
 
@@ -66,128 +129,113 @@ def create_collect_routes(deps: RouteDependencies) -> List[Route]:
                 )
 
             projects_raw = data.get("projects")
-            if projects_raw is None:
-                projects_list: List[Mapping[str, Any]] = []
-            elif isinstance(projects_raw, list):
-                projects_list = [
-                    entry
-                    for entry in projects_raw
-                    if isinstance(entry, Mapping)
-                ]
-                if len(projects_list) != len(projects_raw):
-                    return envelope_response(
-                        envelope_error(
-                            ErrorCode.INVALID_REQUEST,
-                            "projects must be an array of objects",
-                        )
-                    )
-            else:
+            if projects_raw is not None and not isinstance(projects_raw, list):
                 return envelope_response(
-                    envelope_error(
-                        ErrorCode.INVALID_REQUEST, "projects must be an array"
-                    )
+                    envelope_error(ErrorCode.INVALID_REQUEST, "projects must be an array")
                 )
+            projects_list, error = _object_list(
+                projects_raw, "projects must be an array of objects"
+            )
+            if error is not None:
+                return error
 
             response_payload: Dict[str, Any] = {
                 "queries": base_payload.get("queries", []),
-                "meta": dict(base_payload.get("meta", {})),
+                # execute_collect builds a fresh meta dict per call, so it is
+                # safe to update in place.
+                "meta": base_payload.get("meta") or {},
             }
 
             aggregate_tokens = int(response_payload["meta"].get("estimate_tokens", 0) or 0)
 
             if projects_list:
-                project_results: List[Dict[str, Any]] = []
+                plans: List[_ProjectPlan] = []
                 for project_entry in projects_list:
                     project_id = project_entry.get("id")
                     if not isinstance(project_id, str) or not project_id:
-                        return envelope_response(
-                            envelope_error(
-                                ErrorCode.INVALID_REQUEST,
-                                "project id must be a non-empty string",
-                            )
+                        return static_error_response(
+                            ErrorCode.INVALID_REQUEST,
+                            "project id must be a non-empty string",
                         )
 
-                    project_queries_raw = project_entry.get("queries")
-                    if project_queries_raw is None:
-                        project_queries: Sequence[Mapping[str, object]] = []
-                    elif isinstance(project_queries_raw, list) and not any(
-                        not isinstance(item, Mapping) for item in project_queries_raw
-                    ):
-                        project_queries = project_queries_raw
-                    else:
-                        return envelope_response(
-                            envelope_error(
-                                ErrorCode.INVALID_REQUEST,
-                                "project queries must be an array of objects",
-                            )
-                        )
+                    project_queries, error = _object_list(
+                        project_entry.get("queries"),
+                        "project queries must be an array of objects",
+                    )
+                    if error is not None:
+                        return error
 
-                    project_budget = project_entry.get("result_budget")
                     project_url_raw = project_entry.get("ghidra_url") or project_entry.get(
                         "base_url"
                     )
-                    project_client = client
-                    project_url: str | None = None
-                    if project_url_raw is not None:
-                        project_url = str(project_url_raw)
-                        project_client = deps.client_factory()
-                        if hasattr(project_client, "base_url"):
-                            try:
-                                project_client.base_url = (
-                                    project_url
-                                    if project_url.endswith("/")
-                                    else f"{project_url}/"
-                                )
-                            except AttributeError:
-                                pass
-
-                    try:
-                        project_payload = execute_collect(
-                            project_client,
-                            project_queries,
-                            result_budget=project_budget
-                            if isinstance(project_budget, Mapping)
-                            else None,
-                        )
-                    except SafetyLimitExceeded as exc:
-                        if project_client is not client:
-                            project_client.close()
+                    project_url = (
+                        str(project_url_raw) if project_url_raw is not None else None
+                    )
+                    plans.append(
+                        _ProjectPlan(project_entry, project_id, project_queries, project_url)
+                    )
+
+                # Each Ghidra instance handles one call at a time, so projects
+                # sharing a backend run in order while distinct backends overlap.
+                groups: Dict[str | None, List[int]] = {}
+                for index, plan in enumerate(plans):
+                    groups.setdefault(_backend_key(plan.backend(client)), []).append(index)
+
+                outcomes: List[_ProjectOutcome | None] = [None] * len(plans)
+
+                def run_group(indices: List[int]) -> None:
+                    for index in indices:
+                        outcome = _run_project(deps, client, plans[index])
+                        outcomes[index] = outcome
+                        if isinstance(outcome, Exception):
+                            return
+
+                if len(groups) == 1:
+                    run_group(next(iter(groups.values())))
+                else:
+                    await asyncio.gather(
+                        *(asyncio.to_thread(run_group, indices) for indices in groups.values())
+                    )
+
+                project_results: List[Dict[str, Any]] = []
+                for plan, outcome in zip(plans, outcomes):
+                    # A group stops at its first failure, so any project left
+                    # unrun is preceded by that failure in request order.
+                    if isinstance(outcome, SafetyLimitExceeded):
                         return envelope_response(
-                            envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
+                            envelope_error(ErrorCode.RESULT_TOO_LARGE, str(outcome))
                         )
-                    except (KeyError, TypeError, ValueError) as exc:
-                        if project_client is not client:
-                            project_client.close()
+                    if isinstance(outcome, Exception):
                         return envelope_response(
-                            envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
+                            envelope_error(ErrorCode.INVALID_REQUEST, str(outcome))
                         )
+                    if outcome is None:
+                        # Unreachable while run_group only stops after a failure.
+                        raise RuntimeError(f"collect project {plan.project_id!r} did not run")
 
-                    project_meta = dict(project_payload.get("meta", {}))
+                    project_meta = outcome.get("meta") or {}
                     estimate = int(project_meta.get("estimate_tokens", 0) or 0)
                     aggregate_tokens += estimate
-                    if project_url is not None:
-                        project_meta.setdefault("ghidra_url", project_url)
+                    if plan.url is not None:
+                        project_meta.setdefault("ghidra_url", plan.url)
 
                     project_result: Dict[str, Any] = {
-                        "id": project_id,
-                        "queries": project_payload.get("queries", []),
+                        "id": plan.project_id,
+                        "queries": outcome.get("queries", []),
                         "meta": project_meta,
                     }
 
-                    metadata = project_entry.get("metadata")
+                    metadata = plan.entry.get("metadata")
                     if metadata is not None:
                         project_result["metadata"] = metadata
 
                     project_results.append(project_result)
 
-                    if project_client is not client:
-                        project_client.close()
-
                 response_payload["projects"] = project_results
 
             response_payload["meta"]["estimate_tokens"] = aggregate_tokens
 
-            valid, errors = validate_payload("collect.v1.json", response_payload)
+            valid, errors = validate_response("collect.v1.json", response_payload)
             if valid:
                 return envelope_response(envelope_ok(response_payload))
             return envelope_response(
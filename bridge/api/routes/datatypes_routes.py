@@ -12,7 +12,7 @@ from ...utils.config import MAX_WRITES_PER_REQUEST
 from ...utils.errors import ErrorCode
 from ...utils.logging import SafetyLimitExceeded, request_scope
 from .._shared import envelope_error, envelope_ok, envelope_response, error_response
-from ..validators import validate_payload
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -31,18 +31,18 @@ def create_datatype_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = datatypes.create_datatype(
                     client,
-                    kind=str(data["kind"]),
-                    name=str(data["name"]),
-                    category=str(data["category"]),
+                    kind=data["kind"],
+                    name=data["name"],
+                    category=data["category"],
                     fields=list(data["fields"]),
-                    dry_run=bool(data.get("dry_run", True)),
+                    dry_run=data.get("dry_run", True),
                     writes_enabled=deps.enable_writes,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("datatypes_create.v1.json", payload)
+            valid, errors = validate_response("datatypes_create.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -63,17 +63,17 @@ def create_datatype_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = datatypes.update_datatype(
                     client,
-                    kind=str(data["kind"]),
-                    path=str(data["path"]),
+                    kind=data["kind"],
+                    path=data["path"],
                     fields=list(data["fields"]),
-                    dry_run=bool(data.get("dry_run", True)),
+                    dry_run=data.get("dry_run", True),
                     writes_enabled=deps.enable_writes,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("datatypes_update.v1.json", payload)
+            valid, errors = validate_response("datatypes_update.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -94,16 +94,16 @@ def create_datatype_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = datatypes.delete_datatype(
                     client,
-                    kind=str(data["kind"]),
-                    path=str(data["path"]),
-                    dry_run=bool(data.get("dry_run", True)),
+                    kind=data["kind"],
+                    path=data["path"],
+                    dry_run=data.get("dry_run", True),
                     writes_enabled=deps.enable_writes,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("datatypes_delete.v1.json", payload)
+            valid, errors = validate_response("datatypes_delete.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -12,7 +12,7 @@ from ...utils.errors import ErrorCode
 from ...utils.hex import parse_hex
 from ...utils.logging import SafetyLimitExceeded, request_scope
 from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -30,14 +30,14 @@ def create_disasm_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = disasm.disassemble_at(
                     client,
-                    address=parse_hex(str(data["address"])),
+                    address=parse_hex(data["address"]),
                     count=int(data.get("count", 16)),
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("disassemble_at.v1.json", payload)
+            valid, errors = validate_response("disassemble_at.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from time import perf_counter
-from typing import Callable, List
+from typing import Callable, Dict, List, Tuple
 from urllib.parse import urljoin
 
 import httpx
@@ -13,8 +13,9 @@ from starlette.responses import JSONResponse
 from starlette.routing import Route
 
 from ...ghidra.client import GhidraClient
+from ...utils import config
 from ...utils.logging import request_scope
-from .._shared import envelope_ok
+from .._shared import envelope_ok, envelope_response
 
 
 def create_health_routes(
@@ -23,8 +24,25 @@ def create_health_routes(
     logger: logging.Logger,
     semaphore: asyncio.Semaphore,
 ) -> List[Route]:
-    async def health_route(request: Request) -> JSONResponse:
-        request.state.enable_writes = enable_writes
+    cache_ttl = config.HEALTH_CACHE_MS / 1000.0
+    last_probe: Tuple[float, Dict[str, object]] | None = None
+    refresh_lock = asyncio.Lock()
+
+    def respond(upstream: Dict[str, object]) -> JSONResponse:
+        payload = {
+            "service": "ghidra-mcp-bridge",
+            "writes_enabled": enable_writes,
+            "ghidra": upstream,
+        }
+        return envelope_response(envelope_ok(payload))
+
+    def cached_probe() -> Dict[str, object] | None:
+        if last_probe is not None and perf_counter() - last_probe[0] < cache_ttl:
+            return last_probe[1]
+        return None
+
+    async def probe() -> JSONResponse:
+        nonlocal last_probe
         client = client_factory()
         try:
             async with semaphore:
@@ -41,7 +59,10 @@ def create_health_routes(
                     probe_path = "projectInfo"
                     probe_url = urljoin(client.base_url, probe_path)
                     try:
-                        response = client._session.get(probe_url, timeout=2.0)
+                        # A slow upstream must not stall the event loop for 2s.
+                        response = await asyncio.to_thread(
+                            client._session.get, probe_url, timeout=2.0
+                        )
                     except httpx.HTTPError as exc:
                         duration_ms = (perf_counter() - start) * 1000.0
                         logger.warning(
@@ -67,13 +88,30 @@ def create_health_routes(
                         )
                         upstream["reachable"] = response.status_code == 200
                         upstream["status_code"] = response.status_code
-                    payload = {
-                        "service": "ghidra-mcp-bridge",
-                        "writes_enabled": enable_writes,
-                        "ghidra": upstream,
-                    }
-                    return JSONResponse(envelope_ok(payload))
+                    # Failures are not cached, so recovery shows on the next poll.
+                    if cache_ttl > 0 and upstream["reachable"]:
+                        last_probe = (perf_counter(), upstream)
+                    return respond(upstream)
         finally:
             client.close()
 
+    async def health_route(request: Request) -> JSONResponse:
+        request.state.enable_writes = enable_writes
+        if cache_ttl <= 0:
+            return await probe()
+        upstream = cached_probe()
+        if upstream is None:
+            # Polls that miss together wait for one probe instead of each
+            # queueing their own behind the plugin slot.
+            async with refresh_lock:
+                upstream = cached_probe()
+                if upstream is None:
+                    return await probe()
+        with request_scope(
+            "health",
+            logger=logger,
+            extra={"path": "/api/health.json", "cached": True},
+        ):
+            return respond(upstream)
+
     return [Route("/api/health.json", health_route, methods=["GET", "HEAD"])]
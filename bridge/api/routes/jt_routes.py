@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import List
 
 from starlette.requests import Request
@@ -14,10 +16,27 @@ from ...utils.errors import ErrorCode
 from ...utils.hex import parse_hex
 from ...utils.logging import SafetyLimitExceeded, request_scope
 from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
+# "0x" plus 16 hex digits covers any 64-bit address; longer strings bypass the cache.
+_RANGE_HEX_CACHE_MAX_LEN = 18
+
+
+@lru_cache(maxsize=64)
+def _cached_range_hex(value: str) -> int:
+    return parse_hex(value)
+
+
+def _parse_range_hex(value: str) -> int:
+    """Parse jt_base/code_min/code_max, which clients resend for every slot."""
+
+    if len(value) > _RANGE_HEX_CACHE_MAX_LEN:
+        return parse_hex(value)
+    return _cached_range_hex(value)
+
+
 def _resolve_adapter(arch: str) -> ArchAdapter:
     from . import adapter_for_arch
 
@@ -34,20 +53,20 @@ def create_jt_routes(deps: RouteDependencies) -> List[Route]:
         ):
             data = await deps.validated_json_body(request, "jt_slot_check.request.v1.json")
             try:
-                adapter = _resolve_adapter(str(data.get("arch", "auto")))
+                adapter = _resolve_adapter(data.get("arch", "auto"))
                 payload = jt.slot_check(
                     client,
-                    jt_base=parse_hex(str(data["jt_base"])),
+                    jt_base=_parse_range_hex(data["jt_base"]),
                     slot_index=int(data["slot_index"]),
-                    code_min=parse_hex(str(data["code_min"])),
-                    code_max=parse_hex(str(data["code_max"])),
+                    code_min=_parse_range_hex(data["code_min"]),
+                    code_max=_parse_range_hex(data["code_max"]),
                     adapter=adapter,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("jt_slot_check.v1.json", payload)
+            valid, errors = validate_response("jt_slot_check.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -66,24 +85,24 @@ def create_jt_routes(deps: RouteDependencies) -> List[Route]:
                 request, "jt_slot_process.request.v1.json"
             )
             try:
-                adapter = _resolve_adapter(str(data.get("arch", "auto")))
+                adapter = _resolve_adapter(data.get("arch", "auto"))
                 payload = jt.slot_process(
                     client,
-                    jt_base=parse_hex(str(data["jt_base"])),
+                    jt_base=_parse_range_hex(data["jt_base"]),
                     slot_index=int(data["slot_index"]),
-                    code_min=parse_hex(str(data["code_min"])),
-                    code_max=parse_hex(str(data["code_max"])),
-                    rename_pattern=str(data.get("rename_pattern", "{target}")),
-                    comment=str(data.get("comment", "")),
+                    code_min=_parse_range_hex(data["code_min"]),
+                    code_max=_parse_range_hex(data["code_max"]),
+                    rename_pattern=data.get("rename_pattern", "{target}"),
+                    comment=data.get("comment", ""),
                     adapter=adapter,
-                    dry_run=bool(data.get("dry_run", True)),
+                    dry_run=data.get("dry_run", True),
                     writes_enabled=deps.enable_writes,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("jt_slot_process.v1.json", payload)
+            valid, errors = validate_response("jt_slot_process.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -99,21 +118,23 @@ def create_jt_routes(deps: RouteDependencies) -> List[Route]:
         ):
             data = await deps.validated_json_body(request, "jt_scan.request.v1.json")
             try:
-                adapter = _resolve_adapter(str(data.get("arch", "auto")))
-                payload = jt.scan(
+                adapter = _resolve_adapter(data.get("arch", "auto"))
+                # One upstream round trip per slot; keep the event loop free meanwhile.
+                payload = await asyncio.to_thread(
+                    jt.scan,
                     client,
-                    jt_base=parse_hex(str(data["jt_base"])),
+                    jt_base=_parse_range_hex(data["jt_base"]),
                     start=int(data["start"]),
                     count=int(data["count"]),
-                    code_min=parse_hex(str(data["code_min"])),
-                    code_max=parse_hex(str(data["code_max"])),
+                    code_min=_parse_range_hex(data["code_min"]),
+                    code_max=_parse_range_hex(data["code_max"]),
                     adapter=adapter,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("jt_scan.v1.json", payload)
+            valid, errors = validate_response("jt_scan.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
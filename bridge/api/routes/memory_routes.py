@@ -13,7 +13,7 @@ from ...utils.errors import ErrorCode
 from ...utils.hex import parse_hex
 from ...utils.logging import SafetyLimitExceeded, request_scope
 from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -31,15 +31,15 @@ def create_memory_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = memory.read_bytes(
                     client,
-                    address=parse_hex(str(data["address"])),
+                    address=parse_hex(data["address"]),
                     length=int(data["length"]),
-                    include_literals=bool(data.get("include_literals", False)),
+                    include_literals=data.get("include_literals", False),
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("read_bytes.v1.json", payload)
+            valid, errors = validate_response("read_bytes.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -60,17 +60,17 @@ def create_memory_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = memory.write_bytes(
                     client,
-                    address=parse_hex(str(data["address"])),
-                    data=str(data["data"]),
-                    encoding=str(data.get("encoding", "base64")),
-                    dry_run=bool(data.get("dry_run", True)),
+                    address=parse_hex(data["address"]),
+                    data=data["data"],
+                    encoding=data.get("encoding", "base64"),
+                    dry_run=data.get("dry_run", True),
                     writes_enabled=deps.enable_writes,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("write_bytes.v1.json", payload)
+            valid, errors = validate_response("write_bytes.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
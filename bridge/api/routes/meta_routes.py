@@ -3,12 +3,13 @@ from __future__ import annotations
 from typing import Iterable, List, Sequence, Tuple
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
+from ...utils import jsoncodec
 from ...utils.logging import request_scope
 from .._shared import envelope_ok
-from ..validators import validate_payload
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 CapabilityEntry = Tuple[str, str, str, str, str]
@@ -64,21 +65,23 @@ def _capability_definitions(enable_writes: bool) -> Iterable[CapabilityEntry]:
 
 
 def create_meta_routes(deps: RouteDependencies) -> List[Route]:
-    async def capabilities_route(request: Request) -> JSONResponse:
+    # The listing only depends on ``enable_writes``, so it is built, checked
+    # and serialised once per route table rather than on every request.
+    payload = {
+        "endpoints": _ordered_capabilities(_capability_definitions(deps.enable_writes))
+    }
+    valid, errors = validate_response("capabilities.v1.json", payload)
+    if not valid:
+        deps.logger.warning("capabilities.validation_failed", extra={"errors": errors})
+    body = jsoncodec.dumps(envelope_ok(payload))
+
+    async def capabilities_route(request: Request) -> Response:
         with request_scope(
             "capabilities",
             logger=deps.logger,
             extra={"path": "/api/capabilities.json"},
         ):
-            payload = {
-                "endpoints": _ordered_capabilities(
-                    _capability_definitions(deps.enable_writes)
-                )
-            }
-            valid, errors = validate_payload("capabilities.v1.json", payload)
-            if not valid:
-                deps.logger.warning("capabilities.validation_failed", extra={"errors": errors})
-            return JSONResponse(envelope_ok(payload))
+            return Response(body, media_type="application/json")
 
     return [
         Route(
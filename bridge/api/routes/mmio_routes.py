@@ -11,8 +11,14 @@ from ...ghidra.client import GhidraClient
 from ...utils.errors import ErrorCode
 from ...utils.hex import parse_hex
 from ...utils.logging import SafetyLimitExceeded, request_scope
-from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from .._shared import (
+    envelope_error,
+    envelope_ok,
+    envelope_response,
+    error_response,
+    static_error_response,
+)
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -30,13 +36,13 @@ def create_mmio_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = mmio.annotate(
                     client,
-                    function_addr=parse_hex(str(data["function_addr"])),
-                    dry_run=bool(data.get("dry_run", True)),
+                    function_addr=parse_hex(data["function_addr"]),
+                    dry_run=data.get("dry_run", True),
                     max_samples=int(data.get("max_samples", 8)),
                     writes_enabled=deps.enable_writes,
                 )
             except mmio.WritesDisabledError:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "Writes are disabled while dry_run is false.",
                     recovery=("Enable writes or run in dry_run mode.",),
@@ -45,7 +51,7 @@ def create_mmio_routes(deps: RouteDependencies) -> List[Route]:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("mmio_annotate.v1.json", payload)
+            valid, errors = validate_response("mmio_annotate.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
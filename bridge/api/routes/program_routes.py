@@ -17,8 +17,14 @@ from ...utils.program_context import (
     validate_program_id,
 )
 from ..tools import _maybe_autoopen_program
-from .._shared import envelope_error, envelope_ok, envelope_response
-from ..validators import validate_payload
+from .._shared import (
+    envelope_error,
+    envelope_ok,
+    envelope_response,
+    static_error_response,
+    upstream_error_response,
+)
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -33,14 +39,11 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
             status_payload = client.get_current_program_status()
             if status_payload is None:
                 upstream = client.last_error.as_dict() if client.last_error else None
-                return envelope_response(
-                    envelope_error(
-                        ErrorCode.UNAVAILABLE,
-                        "Failed to query the current program status upstream.",
-                        upstream_error=upstream,
-                        recovery=("Ensure a program is open in Ghidra.",),
-                        status=503,
-                    )
+                return upstream_error_response(
+                    ErrorCode.UNAVAILABLE,
+                    "Failed to query the current program status upstream.",
+                    upstream_error=upstream,
+                    recovery=("Ensure a program is open in Ghidra.",),
                 )
 
             requestor = getattr(request.state, "program_requestor", None) or requestor_from_request(
@@ -50,14 +53,11 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
 
             if files is None:
                 upstream = client.last_error.as_dict() if client.last_error else None
-                return envelope_response(
-                    envelope_error(
-                        ErrorCode.UNAVAILABLE,
-                        "Failed to enumerate project files.",
-                        upstream_error=upstream,
-                        recovery=("Ensure a project is open in Ghidra.",),
-                        status=503,
-                    )
+                return upstream_error_response(
+                    ErrorCode.UNAVAILABLE,
+                    "Failed to enumerate project files.",
+                    upstream_error=upstream,
+                    recovery=("Ensure a project is open in Ghidra.",),
                 )
 
             try:
@@ -80,13 +80,10 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
             if selection.warning:
                 warnings.append(selection.warning)
             if state.domain_file_id is None:
-                return envelope_response(
-                    envelope_error(
-                        ErrorCode.UNAVAILABLE,
-                        "No program files are available in the current project.",
-                        recovery=("Open a program in Ghidra and retry.",),
-                        status=503,
-                    )
+                return static_error_response(
+                    ErrorCode.UNAVAILABLE,
+                    "No program files are available in the current project.",
+                    recovery=("Open a program in Ghidra and retry.",),
                 )
 
             upstream_warnings = (
@@ -113,13 +110,10 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
                 )
 
             if selected_domain is None:
-                return envelope_response(
-                    envelope_error(
-                        ErrorCode.UNAVAILABLE,
-                        "No program files are available in the current project.",
-                        recovery=("Open a program in Ghidra and retry.",),
-                        status=503,
-                    )
+                return static_error_response(
+                    ErrorCode.UNAVAILABLE,
+                    "No program files are available in the current project.",
+                    recovery=("Open a program in Ghidra and retry.",),
                 )
 
             payload = {
@@ -129,7 +123,7 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
             }
             if combined_warnings:
                 payload["warnings"] = combined_warnings
-            valid, errors = validate_payload("current_program.v1.json", payload)
+            valid, errors = validate_response("current_program.v1.json", payload)
             if not valid:
                 return envelope_response(
                     envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
@@ -152,14 +146,11 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
 
             if files is None:
                 upstream = client.last_error.as_dict() if client.last_error else None
-                return envelope_response(
-                    envelope_error(
-                        ErrorCode.UNAVAILABLE,
-                        "Failed to enumerate project files.",
-                        upstream_error=upstream,
-                        recovery=("Ensure a project is open in Ghidra.",),
-                        status=503,
-                    )
+                return upstream_error_response(
+                    ErrorCode.UNAVAILABLE,
+                    "Failed to enumerate project files.",
+                    upstream_error=upstream,
+                    recovery=("Ensure a project is open in Ghidra.",),
                 )
 
             if not validate_program_id(files, domain_file_id):
@@ -215,7 +206,7 @@ def create_program_routes(deps: RouteDependencies) -> List[Route]:
         }
         if warnings:
             payload["warnings"] = warnings
-        valid, errors = validate_payload("current_program.v1.json", payload)
+        valid, errors = validate_response("current_program.v1.json", payload)
         if not valid:
             return envelope_response(
                 envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
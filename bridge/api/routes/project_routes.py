@@ -12,8 +12,14 @@ from ...utils import config
 from ...utils.errors import ErrorCode
 from ...utils.hex import parse_hex
 from ...utils.logging import request_scope
-from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from .._shared import (
+    envelope_error,
+    envelope_ok,
+    envelope_response,
+    error_response,
+    upstream_error_response,
+)
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
@@ -35,7 +41,7 @@ def create_project_routes(deps: RouteDependencies) -> List[Route]:
                     status_val = upstream.get("status")
                     if isinstance(status_val, int):
                         status = status_val
-                return error_response(
+                return upstream_error_response(
                     ErrorCode.UNAVAILABLE,
                     message or None,
                     upstream_error=upstream,
@@ -58,15 +64,15 @@ def create_project_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = project.rebase_project(
                     client,
-                    new_base=parse_hex(str(data["new_base"])),
-                    dry_run=bool(data.get("dry_run", True)),
-                    confirm=bool(data.get("confirm", False)),
+                    new_base=parse_hex(data["new_base"]),
+                    dry_run=data.get("dry_run", True),
+                    confirm=data.get("confirm", False),
                     writes_enabled=deps.enable_writes,
                     rebases_enabled=config.ENABLE_PROJECT_REBASE,
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
-            valid, errors = validate_payload("project_rebase.v1.json", payload)
+            valid, errors = validate_response("project_rebase.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -92,7 +98,7 @@ def create_project_routes(deps: RouteDependencies) -> List[Route]:
                     status_val = upstream.get("status")
                     if isinstance(status_val, int):
                         status = status_val
-                return error_response(
+                return upstream_error_response(
                     ErrorCode.UNAVAILABLE,
                     message or None,
                     upstream_error=upstream,
@@ -100,7 +106,7 @@ def create_project_routes(deps: RouteDependencies) -> List[Route]:
                 )
             files = _normalise_project_files(payload)
             response = {"files": files}
-            valid, errors = validate_payload("project_overview.v1.json", response)
+            valid, errors = validate_response("project_overview.v1.json", response)
             if valid:
                 return envelope_response(envelope_ok(response))
             return envelope_response(
@@ -173,17 +179,15 @@ def _normalise_project_info(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     blocks = payload.get("memory_blocks")
     if isinstance(blocks, list):
-        normalised_blocks: List[Dict[str, Any]] = []
-        for block in blocks:
-            if isinstance(block, dict):
-                normalised_blocks.append(dict(block))
+        # Blocks are only reordered, never modified, so they are not copied.
+        normalised_blocks = [block for block in blocks if isinstance(block, dict)]
         normalised_blocks.sort(key=_block_sort_key)
         data["memory_blocks"] = normalised_blocks
 
     return data
 
 
-def _block_sort_key(block: Dict[str, Any]) -> tuple[int, str]:
+def _block_sort_key(block: Dict[str, Any]) -> tuple[int, int | str]:
     start = block.get("start")
     if isinstance(start, str):
         try:
@@ -191,5 +195,6 @@ def _block_sort_key(block: Dict[str, Any]) -> tuple[int, str]:
         except ValueError:
             pass
         else:
-            return (0, f"{value:016x}")
+            # The leading bucket keeps ints and strings from being compared.
+            return (0, value)
     return (1, str(start))
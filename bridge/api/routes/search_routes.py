@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
 from ...features import (
@@ -24,19 +24,25 @@ from ...utils.logging import (
     increment_counter,
     request_scope,
 )
-from .._shared import envelope_ok, envelope_response, error_response, envelope_error
-from ..validators import validate_payload
+from .._shared import (
+    envelope_error,
+    envelope_ok,
+    envelope_response,
+    error_response,
+    static_error_response,
+)
+from ..validators import validate_response
 from ._common import RouteDependencies
 
 
-def _validate_pagination(limit: int, page: int) -> JSONResponse | None:
+def _validate_pagination(limit: int, page: int) -> Response | None:
     if limit <= 0:
-        return error_response(
+        return static_error_response(
             ErrorCode.INVALID_REQUEST,
             "limit must be a positive integer.",
         )
     if page <= 0:
-        return error_response(
+        return static_error_response(
             ErrorCode.INVALID_REQUEST,
             "page must be a positive integer.",
         )
@@ -60,14 +66,14 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 payload = strings.xrefs_compact(
                     client,
-                    string_addr=parse_hex(str(data["string_addr"])),
+                    string_addr=parse_hex(data["string_addr"]),
                     limit=int(data.get("limit", 50)),
                 )
             except (KeyError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("string_xrefs.v1.json", payload)
+            valid, errors = validate_response("string_xrefs.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -85,10 +91,10 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 request, "search_strings.request.v1.json"
             )
             try:
-                query = str(data["query"])
+                query = data["query"]
                 limit = int(data.get("limit", 100))
                 page = int(data.get("page", 1))
-                include_literals = bool(data.get("include_literals", False))
+                include_literals = data.get("include_literals", False)
             except (KeyError, TypeError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             pagination_error = _validate_pagination(limit, page)
@@ -104,7 +110,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 )
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("search_strings.v1.json", payload)
+            valid, errors = validate_response("search_strings.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -124,16 +130,16 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
             try:
                 limit = int(data.get("limit", 0))
                 offset = int(data.get("offset", 0))
-                include_literals = bool(data.get("include_literals", False))
+                include_literals = data.get("include_literals", False)
             except (TypeError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             if limit <= 0:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "limit must be a positive integer.",
                 )
             if offset < 0:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "offset must be a non-negative integer.",
                 )
@@ -154,7 +160,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
             except (TypeError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
 
-            valid, errors = validate_payload("strings_compact.v1.json", payload)
+            valid, errors = validate_response("strings_compact.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -172,7 +178,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 request, "search_imports.request.v1.json"
             )
             try:
-                query = str(data["query"])
+                query = data["query"]
                 limit = int(data.get("limit", 100))
                 page = int(data.get("page", 1))
             except (KeyError, TypeError, ValueError) as exc:
@@ -189,7 +195,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 )
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("search_imports.v1.json", payload)
+            valid, errors = validate_response("search_imports.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -207,7 +213,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 request, "search_exports.request.v1.json"
             )
             try:
-                query = str(data["query"])
+                query = data["query"]
                 limit = int(data.get("limit", 100))
                 page = int(data.get("page", 1))
             except (KeyError, TypeError, ValueError) as exc:
@@ -224,7 +230,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 )
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("search_exports.v1.json", payload)
+            valid, errors = validate_response("search_exports.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -242,8 +248,8 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 request, "search_xrefs_to.request.v1.json"
             )
             try:
-                address = str(data["address"])
-                query = str(data["query"])
+                address = data["address"]
+                query = data["query"]
                 limit = int(data.get("limit", 100))
                 page = int(data.get("page", 1))
             except (KeyError, TypeError, ValueError) as exc:
@@ -263,7 +269,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("search_xrefs_to.v1.json", payload)
+            valid, errors = validate_response("search_xrefs_to.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -281,7 +287,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 request, "search_functions.request.v1.json"
             )
             try:
-                query = str(data["query"])
+                query = data["query"]
                 limit = int(data.get("limit", 100))
                 page = int(data.get("page", 1))
                 cursor_token_raw = data.get("resume_cursor")
@@ -293,7 +299,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 elif isinstance(cursor_token_raw, str):
                     cursor_token = cursor_token_raw
                 else:
-                    return error_response(
+                    return static_error_response(
                         ErrorCode.INVALID_REQUEST,
                         "cursor must be a string if provided.",
                     )
@@ -303,7 +309,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
 
             if context_lines < 0 or context_lines > MAX_FUNCTION_CONTEXT_LINES:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     f"context_lines must be between 0 and {MAX_FUNCTION_CONTEXT_LINES}.",
                 )
@@ -315,13 +321,13 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
             elif isinstance(rank_raw, str):
                 rank = rank_raw
             else:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "rank must be a string.",
                 )
 
             if rank is not None and rank not in {"simple"}:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "rank must be one of: simple.",
                 )
@@ -332,22 +338,22 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 try:
                     k = int(k_raw)
                 except (TypeError, ValueError):
-                    return error_response(
+                    return static_error_response(
                         ErrorCode.INVALID_REQUEST,
                         "k must be a positive integer.",
                     )
                 if k <= 0:
-                    return error_response(
+                    return static_error_response(
                         ErrorCode.INVALID_REQUEST,
                         "k must be a positive integer.",
                     )
                 if rank != "simple":
-                    return error_response(
+                    return static_error_response(
                         ErrorCode.INVALID_REQUEST,
                         'k requires rank="simple".',
                     )
             if cursor_token is not None and rank is not None:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "cursor pagination cannot be combined with rank.",
                 )
@@ -367,7 +373,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 )
             except SafetyLimitExceeded as exc:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
-            valid, errors = validate_payload("search_functions.v1.json", payload)
+            valid, errors = validate_response("search_functions.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -406,14 +412,14 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 elif isinstance(cursor_token_raw, str):
                     cursor_token = cursor_token_raw
                 else:
-                    return error_response(
+                    return static_error_response(
                         ErrorCode.INVALID_REQUEST,
                         "cursor must be a string if provided.",
                     )
             except (KeyError, TypeError, ValueError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
             if limit <= 0 or page <= 0:
-                return error_response(
+                return static_error_response(
                     ErrorCode.INVALID_REQUEST,
                     "limit and page must be positive integers.",
                 )
@@ -430,7 +436,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
             except (ValueError, TypeError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
-            valid, errors = validate_payload("search_scalars.v1.json", payload)
+            valid, errors = validate_response("search_scalars.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -448,8 +454,8 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 request, "list_functions_in_range.request.v1.json"
             )
             try:
-                address_min = str(data["address_min"])
-                address_max = str(data["address_max"])
+                address_min = data["address_min"]
+                address_max = data["address_max"]
                 limit = int(data.get("limit", 200))
                 page = int(data.get("page", 1))
             except (KeyError, TypeError, ValueError) as exc:
@@ -466,7 +472,7 @@ def create_search_routes(deps: RouteDependencies) -> List[Route]:
                 return error_response(ErrorCode.RESULT_TOO_LARGE, str(exc))
             except (ValueError, TypeError) as exc:
                 return error_response(ErrorCode.INVALID_REQUEST, str(exc))
-            valid, errors = validate_payload("list_functions_in_range.v1.json", payload)
+            valid, errors = validate_response("list_functions_in_range.v1.json", payload)
             if valid:
                 return envelope_response(envelope_ok(payload))
             return envelope_response(
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from functools import wraps
-from typing import Any, Callable, Dict, List, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence
 
 from mcp.server.fastmcp import FastMCP
 
@@ -66,6 +66,14 @@ else:  # pragma: no cover - fallback when operations are unavailable
     _COLLECT_OP_HINT = f"See {COLLECT_DOCS_URL} for supported 'op' values."
 
 
+def _validate_result(schema_name: str, payload: Dict[str, Any]) -> tuple[bool, List[str]]:
+    """Check a tool result against its schema unless response validation is off."""
+
+    if not config.VALIDATE_RESPONSES:
+        return True, []
+    return validate_payload(schema_name, payload)
+
+
 def _find_program_entry(files: object, domain_file_id: str) -> Mapping[str, object] | None:
     if not isinstance(files, Sequence):
         return None
@@ -395,7 +403,7 @@ def register_tools(
                 )
             normalized = _normalise_project_info(payload)
 
-        valid, errors = validate_payload("project_info.v1.json", normalized)
+        valid, errors = _validate_result("project_info.v1.json", normalized)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(normalized)
@@ -428,7 +436,7 @@ def register_tools(
 
         response_payload = {"files": files}
 
-        valid, errors = validate_payload("project_overview.v1.json", response_payload)
+        valid, errors = _validate_result("project_overview.v1.json", response_payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(response_payload)
@@ -517,7 +525,7 @@ def register_tools(
         }
         if warnings:
             payload["warnings"] = warnings
-        valid, errors = validate_payload("current_program.v1.json", payload)
+        valid, errors = _validate_result("current_program.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -598,7 +606,7 @@ def register_tools(
         }
         if warnings:
             payload["warnings"] = warnings
-        valid, errors = validate_payload("current_program.v1.json", payload)
+        valid, errors = _validate_result("current_program.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -953,7 +961,7 @@ def register_tools(
             except ValueError as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload("project_rebase.v1.json", payload)
+        valid, errors = _validate_result("project_rebase.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -1009,7 +1017,7 @@ def register_tools(
             except ValueError as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload(
+        valid, errors = _validate_result(
             "analyze_function_complete.v1.json", payload
         )
         if not valid:
@@ -1213,7 +1221,7 @@ def register_tools(
 
         response_payload["meta"]["estimate_tokens"] = aggregate_tokens
 
-        valid, errors = validate_payload("collect.v1.json", response_payload)
+        valid, errors = _validate_result("collect.v1.json", response_payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(response_payload)
@@ -1261,7 +1269,7 @@ def register_tools(
             except (KeyError, ValueError) as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload("datatypes_create.v1.json", payload)
+        valid, errors = _validate_result("datatypes_create.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -1306,7 +1314,7 @@ def register_tools(
             except (KeyError, ValueError) as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload("datatypes_update.v1.json", payload)
+        valid, errors = _validate_result("datatypes_update.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -1348,7 +1356,7 @@ def register_tools(
             except (KeyError, ValueError) as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload("datatypes_delete.v1.json", payload)
+        valid, errors = _validate_result("datatypes_delete.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -1398,7 +1406,7 @@ def register_tools(
             except (KeyError, ValueError) as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload("write_bytes.v1.json", payload)
+        valid, errors = _validate_result("write_bytes.v1.json", payload)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(payload)
@@ -1438,7 +1446,7 @@ def register_tools(
                 code_max=parse_hex(code_max),
                 adapter=adapter,
             )
-        valid, errors = validate_payload("jt_slot_check.v1.json", data)
+        valid, errors = _validate_result("jt_slot_check.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1492,7 +1500,7 @@ def register_tools(
                 )
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
-        valid, errors = validate_payload("jt_slot_process.v1.json", data)
+        valid, errors = _validate_result("jt_slot_process.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1535,7 +1543,7 @@ def register_tools(
                 code_max=parse_hex(code_max),
                 adapter=adapter,
             )
-        valid, errors = validate_payload("jt_scan.v1.json", data)
+        valid, errors = _validate_result("jt_scan.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1565,7 +1573,7 @@ def register_tools(
                 string_addr=parse_hex(string_addr),
                 limit=limit,
             )
-        valid, errors = validate_payload("string_xrefs.v1.json", data)
+        valid, errors = _validate_result("string_xrefs.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1605,7 +1613,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_strings.v1.json", data)
+        valid, errors = _validate_result("search_strings.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1638,11 +1646,11 @@ def register_tools(
             extra={"tool": "strings_compact"},
         ):
             increment_counter("strings.compact.calls")
-            raw_entries: list[dict[str, object]] = []
+            raw_entries: Iterable[Mapping[str, object]] = ()
             fetcher = getattr(client, "list_strings_compact", None)
             if callable(fetcher):
                 result = fetcher(limit=limit, offset=offset)
-                raw_entries = [] if result is None else list(result)
+                raw_entries = () if result is None else result
             else:
                 fallback = getattr(client, "list_strings", None)
                 if callable(fallback):
@@ -1650,7 +1658,7 @@ def register_tools(
                         result = fallback(limit=limit, offset=offset)
                     except TypeError:
                         result = fallback(limit=limit)
-                    raw_entries = [] if result is None else list(result)
+                    raw_entries = () if result is None else result
             try:
                 data = strings.strings_compact_view(
                     raw_entries, include_literals=include_literals
@@ -1658,7 +1666,7 @@ def register_tools(
             except (TypeError, ValueError) as exc:
                 return envelope_error(ErrorCode.INVALID_REQUEST, str(exc))
 
-        valid, errors = validate_payload("strings_compact.v1.json", data)
+        valid, errors = _validate_result("strings_compact.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1695,7 +1703,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_imports.v1.json", data)
+        valid, errors = _validate_result("search_imports.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1732,7 +1740,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_exports.v1.json", data)
+        valid, errors = _validate_result("search_exports.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1778,7 +1786,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_xrefs_to.v1.json", data)
+        valid, errors = _validate_result("search_xrefs_to.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1844,7 +1852,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_functions.v1.json", data)
+        valid, errors = _validate_result("search_functions.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1952,7 +1960,7 @@ def register_tools(
                 ErrorCode.INVALID_REQUEST,
                 "Writes are disabled while dry_run is false.",
             )
-        valid, errors = validate_payload("mmio_annotate.v1.json", data)
+        valid, errors = _validate_result("mmio_annotate.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -1999,7 +2007,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_scalars.v1.json", data)
+        valid, errors = _validate_result("search_scalars.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2043,7 +2051,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("list_functions_in_range.v1.json", data)
+        valid, errors = _validate_result("list_functions_in_range.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2076,7 +2084,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("disassemble_at.v1.json", data)
+        valid, errors = _validate_result("disassemble_at.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2115,7 +2123,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("read_bytes.v1.json", data)
+        valid, errors = _validate_result("read_bytes.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2159,7 +2167,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("disassemble_batch.v1.json", data)
+        valid, errors = _validate_result("disassemble_batch.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2210,7 +2218,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("read_words.v1.json", data)
+        valid, errors = _validate_result("read_words.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2270,7 +2278,7 @@ def register_tools(
         except SafetyLimitExceeded as exc:
             return envelope_error(ErrorCode.RESULT_TOO_LARGE, str(exc))
 
-        valid, errors = validate_payload("search_scalars_with_context.v1.json", data)
+        valid, errors = _validate_result("search_scalars_with_context.v1.json", data)
         if not valid:
             return envelope_error(ErrorCode.INVALID_REQUEST, "; ".join(errors))
         return envelope_ok(data)
@@ -2322,17 +2330,15 @@ def _normalise_project_info(payload: Mapping[str, Any]) -> Dict[str, Any]:
 
     blocks = payload.get("memory_blocks")
     if isinstance(blocks, list):
-        normalised_blocks: List[Dict[str, Any]] = []
-        for block in blocks:
-            if isinstance(block, Mapping):
-                normalised_blocks.append(dict(block))
+        # Blocks are only reordered, never modified, so they are not copied.
+        normalised_blocks = [block for block in blocks if isinstance(block, Mapping)]
         normalised_blocks.sort(key=_block_sort_key)
         data["memory_blocks"] = normalised_blocks
 
     return data
 
 
-def _block_sort_key(block: Mapping[str, Any]) -> tuple[int, str]:
+def _block_sort_key(block: Mapping[str, Any]) -> tuple[int, int | str]:
     start = block.get("start")
     if isinstance(start, str):
         try:
@@ -2340,7 +2346,8 @@ def _block_sort_key(block: Mapping[str, Any]) -> tuple[int, str]:
         except ValueError:
             pass
         else:
-            return (0, f"{value:016x}")
+            # The leading bucket keeps ints and strings from being compared.
+            return (0, value)
     return (1, str(start))
 
 
@@ -4,11 +4,18 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from importlib import resources
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from jsonschema import Draft202012Validator
 from referencing import Registry, Resource
 
+from ..utils import config
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fastjsonschema is pinned; jsonschema is the fallback
+    fastjsonschema = None  # type: ignore[assignment]
+
 
 @lru_cache(maxsize=None)
 def _schema_contents(name: str) -> Dict[str, Any]:
@@ -17,27 +24,77 @@ def _schema_contents(name: str) -> Dict[str, Any]:
 
 
 @lru_cache(maxsize=1)
-def _registry() -> Registry:
-    registry = Registry()
+def _schemas_by_id() -> Dict[str, Dict[str, Any]]:
+    schemas: Dict[str, Dict[str, Any]] = {}
     package = resources.files("bridge.api.schemas")
     for entry in package.iterdir():
         if entry.name.endswith(".json"):
             contents = _schema_contents(entry.name)
             schema_id = contents.get("$id")
             if schema_id:
-                registry = registry.with_resource(schema_id, Resource.from_contents(contents))
+                schemas[schema_id] = contents
+    return schemas
+
+
+@lru_cache(maxsize=1)
+def _registry() -> Registry:
+    registry = Registry()
+    for schema_id, contents in _schemas_by_id().items():
+        registry = registry.with_resource(schema_id, Resource.from_contents(contents))
     return registry
 
 
 @lru_cache(maxsize=None)
 def _load_schema(name: str) -> Draft202012Validator:
+    """Build (once per schema name) the validator reused by every request."""
+
     schema = _schema_contents(name)
+    Draft202012Validator.check_schema(schema)
     return Draft202012Validator(schema, registry=_registry())
 
 
+@lru_cache(maxsize=None)
+def _compiled_schema(name: str) -> Optional[Callable[[Any], Any]]:
+    """Return generated validation code for ``name`` when fastjsonschema is available."""
+
+    if fastjsonschema is None:  # pragma: no cover - fastjsonschema is pinned; jsonschema is the fallback
+        return None
+    try:
+        return fastjsonschema.compile(
+            _schema_contents(name),
+            handlers={"urn": lambda uri: _schemas_by_id()[uri]},
+            use_default=False,
+        )
+    except fastjsonschema.JsonSchemaDefinitionException:  # pragma: no cover - unsupported keyword
+        return None
+
+
+def warm_validators() -> None:
+    """Load and compile every bundled schema so no request pays for it."""
+
+    for entry in resources.files("bridge.api.schemas").iterdir():
+        if entry.name.endswith(".json"):
+            _load_schema(entry.name)
+            _compiled_schema(entry.name)
+
+
 def validate_payload(schema_name: str, payload: Dict[str, Any]) -> Tuple[bool, List[str]]:
-    validator = _load_schema(schema_name)
-    errors: List[str] = []
-    for error in validator.iter_errors(payload):
-        errors.append(error.message)
+    compiled = _compiled_schema(schema_name)
+    if compiled is not None:
+        try:
+            compiled(payload)
+        except fastjsonschema.JsonSchemaException:
+            # Let jsonschema produce the full, stable list of error messages.
+            pass
+        else:
+            return True, []
+    errors = [error.message for error in _load_schema(schema_name).iter_errors(payload)]
     return not errors, errors
+
+
+def validate_response(schema_name: str, payload: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """Validate a payload the bridge built itself, unless disabled by config."""
+
+    if not config.VALIDATE_RESPONSES:
+        return True, []
+    return validate_payload(schema_name, payload)
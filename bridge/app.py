@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextlib
 import json
 import logging
 import os
+import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -13,6 +15,7 @@ from types import MethodType
 from importlib import resources
 from functools import lru_cache
 
+import httpx
 from mcp import types
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.server import SseServerTransport
@@ -21,9 +24,11 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from starlette.routing import Mount, Route
 
-from .api._shared import envelope_error, envelope_response
+from .api._shared import envelope_error, envelope_response, json_response
 from .api.routes import make_routes
+from .api.routes._router import LiteralRouter
 from .api.tools import register_tools
+from .api.validators import warm_validators
 from .error_handlers import install_error_handlers
 from .ghidra.client import GhidraClient
 from .utils.env import load_env
@@ -34,6 +39,8 @@ MCP_SERVER = FastMCP("ghidra-bridge")
 load_env()
 _ghidra_server_url = os.getenv("GHIDRA_SERVER_URL", "http://127.0.0.1:8080/")
 _CONFIGURED = False
+_SHARED_SESSION: httpx.Client | None = None
+_SESSION_LOCK = threading.Lock()
 
 
 @dataclass(slots=True)
@@ -176,8 +183,31 @@ def set_ghidra_base_url(url: str) -> None:
     _ghidra_server_url = url
 
 
+def _shared_session() -> httpx.Client:
+    """Return the process-wide connection pool shared by factory-built clients."""
+
+    global _SHARED_SESSION
+    session = _SHARED_SESSION
+    if session is None or session.is_closed:
+        with _SESSION_LOCK:
+            if _SHARED_SESSION is None or _SHARED_SESSION.is_closed:
+                _SHARED_SESSION = httpx.Client(timeout=30.0)
+            session = _SHARED_SESSION
+    return session
+
+
+@atexit.register
+def _close_shared_session() -> None:
+    if _SHARED_SESSION is not None:
+        _SHARED_SESSION.close()
+
+
 def _client_factory() -> GhidraClient:
-    return GhidraClient(_ghidra_server_url)
+    # Callers own the returned client and may re-point ``base_url`` (collect's
+    # per-project queries do), so hand out a fresh one per call. It borrows the
+    # shared pool, which keeps upstream connections alive across requests and
+    # makes ``close()`` cheap.
+    return GhidraClient(_ghidra_server_url, session=_shared_session())
 
 
 def configure() -> None:
@@ -371,7 +401,7 @@ def _guarded_sse_app(self: FastMCP) -> Starlette:
             status=405,
             recovery=("Use GET when establishing the SSE stream.",),
         )
-        return JSONResponse(payload, status_code=405, headers={"Allow": "GET"})
+        return json_response(payload, status_code=405, headers={"Allow": "GET"})
 
     async def handle_message(scope, receive, send) -> None:  # type: ignore[override]
         if scope.get("type") != "http":  # pragma: no cover - defensive
@@ -415,11 +445,20 @@ def _guarded_sse_app(self: FastMCP) -> Starlette:
     )
 
 
+@contextlib.asynccontextmanager
+async def _api_lifespan(_: Starlette):
+    # Schema loading and code generation take a noticeable fraction of a second;
+    # do it before serving rather than on each route's first request.
+    warm_validators()
+    yield
+
+
 def build_api_app() -> Starlette:
     configure()
     
     # Install error handlers
     app = Starlette()
+    app.router = LiteralRouter(lifespan=_api_lifespan)
     install_error_handlers(app)
     
     async def state(_: Request) -> JSONResponse:
@@ -433,7 +472,7 @@ def build_api_app() -> Starlette:
                 "connects": _BRIDGE_STATE.connects,
                 "last_init_ts": _BRIDGE_STATE.last_init_ts,
             }
-        return JSONResponse(payload)
+        return json_response(payload)
 
     state_route = Route("/state", state, methods=["GET"], name="state")
 
@@ -441,7 +480,7 @@ def build_api_app() -> Starlette:
     schema = _build_openapi_schema([*routes, state_route])
 
     async def openapi(_: Request) -> JSONResponse:
-        return JSONResponse(schema)
+        return json_response(schema)
 
     openapi_route = Route(
         "/openapi.json", openapi, methods=["GET"], name="openapi"
@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 from starlette.responses import JSONResponse
 from starlette.requests import Request
 
+from .api._shared import json_response
 from .utils.logging import current_request
 
 log = logging.getLogger(__name__)
@@ -59,7 +60,7 @@ def _render_validation_error(
         "%s: %s", summary, exc, extra={"correlation_id": correlation_id}
     )
     debug = getattr(request.app, "debug", False)
-    return JSONResponse(
+    return json_response(
         status_code=400,
         content=make_400_response(
             debug=debug, correlation_id=correlation_id, summary=summary
@@ -458,7 +458,7 @@ def execute_collect(
         if notes:
             meta["notes"] = notes
 
-        results.append({"id": qid, "op": op, "result": envelope, "meta": dict(meta)})
+        results.append({"id": qid, "op": op, "result": envelope, "meta": meta})
 
     response_meta: Dict[str, object] = {
         "estimate_tokens": total_estimate,
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from itertools import islice
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from ..ghidra.client import GhidraClient
@@ -258,18 +259,19 @@ def search_strings(
 
 def fetch_strings_compact_entries(
     client: object, *, limit: int, offset: int
-) -> List[Mapping[str, object]]:
+) -> Iterable[Mapping[str, object]]:
     """Collect raw string metadata for ``strings_compact`` responses.
 
     Attempts the most specific provider first (``list_strings_compact``),
     followed by older ``list_strings`` implementations, and finally the
     broad ``search_strings`` API when compact listings are unavailable.
+    Provider results are passed through as-is; callers iterate them once.
     """
 
     fetcher = getattr(client, "list_strings_compact", None)
     if callable(fetcher):
         result = fetcher(limit=limit, offset=offset)
-        return [] if result is None else list(result)
+        return () if result is None else result
 
     fallback = getattr(client, "list_strings", None)
     if callable(fallback):
@@ -277,13 +279,14 @@ def fetch_strings_compact_entries(
             result = fallback(limit=limit, offset=offset)
         except TypeError:
             result = fallback(limit=limit)
-        return [] if result is None else list(result)
+        return () if result is None else result
 
     search_fallback = getattr(client, "search_strings", None)
     if callable(search_fallback):
         result = search_fallback("")
         entries: Iterable[Mapping[str, object]] = [] if result is None else result
-        return list(entries)[offset : offset + limit]
+        # Copy only the requested window, not the program's whole string table.
+        return list(islice(entries, offset, offset + limit))
 
     return []
 
@@ -305,7 +308,7 @@ def _truncate_literal(value: str, *, max_len: int = 120) -> str:
 
 
 def strings_compact_view(
-    entries: Sequence[Mapping[str, object]],
+    entries: Iterable[Mapping[str, object]],
     *,
     include_literals: bool = False,
 ) -> Dict[str, object]:
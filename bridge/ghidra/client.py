@@ -212,6 +212,72 @@ class DataTypeOperationResult:
     transport_error: Optional[RequestError] = None
 
 
+# Payload validators are immutable, so every client shares one set.
+_PAYLOAD_VALIDATORS: Mapping[str, Draft202012Validator] = {
+    "xrefs": Draft202012Validator(
+        {
+            "type": "object",
+            "required": ["items", "has_more"],
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["address", "context"],
+                        "properties": {
+                            "address": {"type": "string"},
+                            "context": {"type": "string"},
+                        },
+                        "additionalProperties": False,
+                    },
+                },
+                "has_more": {"type": "boolean"},
+                "error": {"type": "string"},
+            },
+            "additionalProperties": False,
+        }
+    ),
+    "strings": Draft202012Validator(
+        {
+            "type": "object",
+            "required": ["items", "has_more"],
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["address", "literal"],
+                        "properties": {
+                            "address": {"type": "string"},
+                            "literal": {"type": "string"},
+                        },
+                        "additionalProperties": False,
+                    },
+                },
+                "has_more": {"type": "boolean"},
+                "error": {"type": "string"},
+            },
+            "additionalProperties": False,
+        }
+    ),
+    "symbols": Draft202012Validator(
+        {
+            "type": "object",
+            "required": ["items", "has_more"],
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                },
+                "has_more": {"type": "boolean"},
+                "error": {"type": "string"},
+            },
+            "additionalProperties": False,
+        }
+    ),
+}
+
+
 class GhidraClient:
     """Small wrapper that handles whitelist enforcement and alias resolution."""
 
@@ -222,77 +288,20 @@ class GhidraClient:
         timeout: float = 30.0,
         whitelist: Optional[Mapping[str, Iterable[WhitelistEntry]]] = None,
         transport: Optional[httpx.BaseTransport] = None,
+        session: Optional[httpx.Client] = None,
     ) -> None:
         self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
         self.timeout = timeout
-        self._session = httpx.Client(timeout=timeout, transport=transport)
+        # A caller-provided session is a shared connection pool; only close our own.
+        self._owns_session = session is None
+        self._session = (
+            session if session is not None else httpx.Client(timeout=timeout, transport=transport)
+        )
         self._whitelist = whitelist or DEFAULT_WHITELIST
         self._get_resolver = EndpointResolver(ENDPOINT_CANDIDATES)
         self._post_resolver = EndpointResolver(POST_ENDPOINT_CANDIDATES)
         self._last_error: Optional[RequestError] = None
-        self._validators = {
-            "xrefs": Draft202012Validator(
-                {
-                    "type": "object",
-                    "required": ["items", "has_more"],
-                    "properties": {
-                        "items": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "required": ["address", "context"],
-                                "properties": {
-                                    "address": {"type": "string"},
-                                    "context": {"type": "string"},
-                                },
-                                "additionalProperties": False,
-                            },
-                        },
-                        "has_more": {"type": "boolean"},
-                        "error": {"type": "string"},
-                    },
-                    "additionalProperties": False,
-                }
-            ),
-            "strings": Draft202012Validator(
-                {
-                    "type": "object",
-                    "required": ["items", "has_more"],
-                    "properties": {
-                        "items": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "required": ["address", "literal"],
-                                "properties": {
-                                    "address": {"type": "string"},
-                                    "literal": {"type": "string"},
-                                },
-                                "additionalProperties": False,
-                            },
-                        },
-                        "has_more": {"type": "boolean"},
-                        "error": {"type": "string"},
-                    },
-                    "additionalProperties": False,
-                }
-            ),
-            "symbols": Draft202012Validator(
-                {
-                    "type": "object",
-                    "required": ["items", "has_more"],
-                    "properties": {
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                        },
-                        "has_more": {"type": "boolean"},
-                        "error": {"type": "string"},
-                    },
-                    "additionalProperties": False,
-                }
-            ),
-        }
+        self._validators = _PAYLOAD_VALIDATORS
 
     # ------------------------------------------------------------------
     # low level
@@ -339,15 +348,21 @@ class GhidraClient:
             return [f"ERROR: endpoint {method} {path} not allowed"]
         url = urljoin(self.base_url, path)
         context = current_request()
-        timer_extra: Dict[str, Any]
-        if context is not None:
-            timer_extra = context.extra(
-                event="timer",
-                operation=f"ghidra.{method.lower()}",
-                path=path,
-            )
-        else:  # pragma: no cover - request scope always set in integration tests
-            timer_extra = {"event": "timer", "operation": f"ghidra.{method.lower()}", "path": path}
+        timer_extra: Optional[Dict[str, Any]] = None
+        # The timer only emits a DEBUG record; don't build its extra otherwise.
+        if logger.isEnabledFor(logging.DEBUG):
+            if context is not None:
+                timer_extra = context.extra(
+                    event="timer",
+                    operation=f"ghidra.{method.lower()}",
+                    path=path,
+                )
+            else:  # pragma: no cover - request scope always set in integration tests
+                timer_extra = {
+                    "event": "timer",
+                    "operation": f"ghidra.{method.lower()}",
+                    "path": path,
+                }
         with scoped_timer(logger, f"ghidra.{method.lower()}", extra=timer_extra):
             start = perf_counter()
             try:
@@ -1492,7 +1507,8 @@ class GhidraClient:
                 self._rollback_transaction(transaction)
 
     def close(self) -> None:
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
     def __enter__(self) -> "GhidraClient":  # pragma: no cover - convenience wrapper
         return self
@@ -1,10 +1,17 @@
+import json
+
 import pytest
 from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.testclient import TestClient
 
 from bridge.utils.errors import ErrorCode
-from bridge.api._shared import envelope_error, envelope_response
+from bridge.api._shared import (
+    envelope_error,
+    envelope_response,
+    static_error_response,
+    upstream_error_response,
+)
 
 
 _EXPECTED_STATUS = {
@@ -35,3 +42,49 @@ def test_envelope_error_contract(code: ErrorCode) -> None:
     error = payload["errors"][0]
     assert error["status"] == _EXPECTED_STATUS[code]
     assert error["code"] == code.value
+
+
+@pytest.mark.parametrize("code", list(ErrorCode))
+def test_static_error_response_matches_envelope_error(code: ErrorCode) -> None:
+    async def handler(_):
+        return static_error_response(code, "fixed message")
+
+    app = Starlette(routes=[Route("/", handler, methods=["GET"])])
+    with TestClient(app) as client:
+        first = client.get("/")
+        second = client.get("/")
+
+    assert first.status_code == _EXPECTED_STATUS[code]
+    assert first.headers["content-type"] == "application/json"
+    assert first.json() == envelope_error(code, "fixed message")
+    assert second.content == first.content
+
+
+def test_static_error_response_carries_recovery() -> None:
+    response = static_error_response(
+        ErrorCode.INVALID_REQUEST, "fixed message", recovery=("Try again.",)
+    )
+
+    assert response.status_code == 400
+    error = json.loads(response.body)["errors"][0]
+    assert error["recovery"] == ["Try again."]
+
+
+def test_upstream_error_response_only_caches_without_upstream_detail() -> None:
+    plain = upstream_error_response(
+        ErrorCode.UNAVAILABLE, "Failed to enumerate project files.", upstream_error=None
+    )
+    assert plain.status_code == 503
+    assert json.loads(plain.body) == envelope_error(
+        ErrorCode.UNAVAILABLE, "Failed to enumerate project files."
+    )
+
+    upstream = {"status": 502, "reason": "bad gateway", "retryable": True}
+    detailed = upstream_error_response(
+        ErrorCode.UNAVAILABLE,
+        "Failed to enumerate project files.",
+        upstream_error=upstream,
+        status=502,
+    )
+    assert detailed.status_code == 502
+    assert json.loads(detailed.body)["errors"][0]["upstream"] == upstream
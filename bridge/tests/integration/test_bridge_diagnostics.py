@@ -47,3 +47,15 @@ def test_state_endpoint_reports_bridge_status() -> None:
         }
 
     _reset_bridge_state()
+
+
+def test_client_factory_clients_share_pool_but_not_base_url() -> None:
+    first = bridge_app._client_factory()
+    first.base_url = "http://127.0.0.1:9999/"
+    first.close()
+
+    second = bridge_app._client_factory()
+    assert second is not first
+    assert second._session is first._session
+    assert not second._session.is_closed
+    assert second.base_url != first.base_url
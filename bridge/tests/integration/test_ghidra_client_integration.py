@@ -73,3 +73,17 @@ def test_ghidra_client_timeouts_are_reported() -> None:
 
     assert client.read_dword(0x1000) is None
     assert client.rename_function(0x1000, "name") is False
+
+
+def test_ghidra_client_leaves_shared_session_open() -> None:
+    session = httpx.Client(transport=httpx.MockTransport(_success_handler))
+    try:
+        first = GhidraClient("http://ghidra/", session=session)
+        assert first.read_dword(0x1000) == 0x1000
+        first.close()
+        assert not session.is_closed
+
+        second = GhidraClient("http://ghidra/", session=session)
+        assert second.read_dword(0x1000) == 0x1000
+    finally:
+        session.close()
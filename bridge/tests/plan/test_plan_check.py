@@ -1,5 +1,5 @@
 # bridge/tests/plan/test_plan_check.py
-import subprocess, sys
+import json, shutil, subprocess, sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[3]
@@ -16,3 +16,14 @@ def test_no_mojibake_and_arrow_present():
     blob = todo + "\n" + man
     assert "â†’" not in blob
     assert "READ→VERIFY" in man
+
+def test_plan_check_skips_bullets_with_empty_ids(tmp_path):
+    (tmp_path / "bin").mkdir()
+    shutil.copy(ROOT / "bin" / "plan_check.py", tmp_path / "bin")
+    plan = tmp_path / ".plan"
+    plan.mkdir()
+    (plan / "TODO.md").write_text("## Next\n- {T.1} Real task\n- {} Empty\n- { } Blank\n", encoding="utf-8")
+    (plan / "tasks.manifest.json").write_text(json.dumps([{"id": "T.1"}]), encoding="utf-8")
+    (plan / "state.json").write_text(json.dumps({"tasks": {"T.1": {"status": "todo"}}}), encoding="utf-8")
+    p = subprocess.run([sys.executable, str(tmp_path / "bin" / "plan_check.py")], cwd=str(tmp_path), capture_output=True, text=True)
+    assert p.returncode == 0, p.stdout + p.stderr
@@ -168,6 +168,16 @@ def test_rejects_invalid_json(client: TestClient) -> None:
     assert meta.get("summary") == "json_decode_error"
 
 
+def test_rejects_deeply_nested_json(client: TestClient) -> None:
+    response = client.post(
+        "/api/read_bytes.json",
+        content=b"[" * 200_000 + b"]" * 200_000,
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 400
+    _assert_generic_400(response.json(), summary="json_decode_error")
+
+
 def test_datatypes_create_rejects_empty_fields(client: TestClient) -> None:
     """Schema validation should reject empty field arrays on newer datatype endpoints."""
 
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import pytest
+
+from bridge.utils import config
+
+
+@pytest.fixture(autouse=True)
+def _validate_tool_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Tests that record validated schema names expect tool results to be checked,
+    # whatever GHIDRA_MCP_VALIDATE_RESPONSES or ``python -O`` says.
+    monkeypatch.setattr(config, "VALIDATE_RESPONSES", True)
@@ -1,4 +1,8 @@
-from bridge.adapters.arm_thumb import ARMThumbAdapter
+import dataclasses
+
+import pytest
+
+from bridge.adapters.arm_thumb import DEFAULT, ARMThumbAdapter
 
 
 class StubClient:
@@ -79,7 +83,30 @@ def test_probe_function_rejects_unverified_targets():
     assert target is None
 
 
+def test_probe_function_rejects_target_inside_function_despite_listing():
+    # The plugin lists from the first instruction at or after the address, so a
+    # listing that starts at the target does not prove it is the entry point.
+    adapter = ARMThumbAdapter()
+    client = StubClient(
+        {
+            0x4004: {
+                "disasm": ["00004004: POP {r4, pc}"],
+                "meta": {"entry_point": 0x4000},
+            }
+        }
+    )
+
+    mode, target = adapter.probe_function(client, 0x4004, 0x1000, 0x8000)
+    assert mode is None
+    assert target is None
+
+
 def test_instruction_sentinel():
     adapter = ARMThumbAdapter()
     assert adapter.is_instruction_sentinel(0xE12FFF1C)
     assert not adapter.is_instruction_sentinel(0x12345678)
+
+
+def test_shared_default_adapter_is_immutable():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        DEFAULT.code_alignment = 2
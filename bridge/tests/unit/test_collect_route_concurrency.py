@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Tuple
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from bridge.api.routes import collect_routes, make_routes
+from bridge.utils.logging import increment_counter
+
+PRIMARY_URL = "http://primary:8080/"
+
+
+class StubClient:
+    def __init__(self) -> None:
+        self.base_url = PRIMARY_URL
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def calls(monkeypatch: pytest.MonkeyPatch) -> List[Tuple[str, str, int]]:
+    recorded: List[Tuple[str, str, int]] = []
+    lock = threading.Lock()
+
+    def fake_execute_collect(
+        client: StubClient, queries: List[Mapping[str, Any]], *, result_budget: Any = None
+    ) -> Dict[str, Any]:
+        for query in queries:
+            with lock:
+                recorded.append((client.base_url, query["id"], threading.get_ident()))
+            if query["id"] == "boom":
+                raise ValueError("boom failed")
+            for _ in range(200):
+                increment_counter("collect.fake")
+            time.sleep(0.01)
+        return {"queries": [], "meta": {"estimate_tokens": 1}}
+
+    monkeypatch.setattr(collect_routes, "execute_collect", fake_execute_collect)
+    return recorded
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    return TestClient(Starlette(routes=make_routes(StubClient)))
+
+
+def _project(project_id: str, url: str | None, *query_ids: str) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "id": project_id,
+        "queries": [
+            {"id": query_id, "op": "search_functions", "params": {}} for query_id in query_ids
+        ],
+    }
+    if url is not None:
+        entry["ghidra_url"] = url
+    return entry
+
+
+def test_collect_keeps_request_order_across_backends(
+    client: TestClient, calls: List[Tuple[str, str, int]]
+) -> None:
+    response = client.post(
+        "/api/collect.json",
+        json={
+            "projects": [
+                _project("a1", "http://a:9000", "a1"),
+                _project("b1", "http://b:9000/", "b1"),
+                _project("a2", "HTTP://A:9000/", "a2"),
+                _project("main", None, "main"),
+            ]
+        },
+    )
+
+    body = response.json()
+    assert body["ok"] is True
+    assert [project["id"] for project in body["data"]["projects"]] == ["a1", "b1", "a2", "main"]
+    threads = {query_id: thread for _, query_id, thread in calls}
+    order = [query_id for _, query_id, _ in calls]
+    # Spellings of one backend share a worker and run in request order;
+    # the other backend runs alongside them.
+    assert threads["a1"] == threads["a2"]
+    assert order.index("a1") < order.index("a2")
+    assert threads["b1"] != threads["a1"]
+    assert body["data"]["meta"]["estimate_tokens"] == 5
+
+
+def test_collect_reports_first_failure_and_stops_its_group(
+    client: TestClient, calls: List[Tuple[str, str, int]]
+) -> None:
+    response = client.post(
+        "/api/collect.json",
+        json={
+            "projects": [
+                _project("a1", "http://a:9000/", "boom"),
+                _project("b1", "http://b:9000/", "b1"),
+                _project("a2", "http://a:9000/", "a2"),
+            ]
+        },
+    )
+
+    body = response.json()
+    assert body["ok"] is False
+    assert body["errors"][0]["code"] == "INVALID_REQUEST"
+    assert "boom failed" in body["errors"][0]["message"]
+    ran = [query_id for _, query_id, _ in calls]
+    assert "a2" not in ran
+    assert "b1" in ran
+
+
+def test_collect_counters_add_up_across_worker_threads(
+    client: TestClient, calls: List[Tuple[str, str, int]], caplog: pytest.LogCaptureFixture
+) -> None:
+    caplog.set_level(logging.INFO)
+    projects = [
+        _project(f"p{index}", f"http://host{index}:9000/", f"q{index}") for index in range(8)
+    ]
+
+    response = client.post("/api/collect.json", json={"projects": projects})
+
+    assert response.json()["ok"] is True
+    finish = [
+        record
+        for record in caplog.records
+        if record.message == "request.finish" and getattr(record, "request", None) == "collect"
+    ]
+    assert finish
+    assert finish[-1].counters["collect.fake"] == 8 * 200
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from bridge.utils import env
+
+
+def test_load_env_reads_dotenv_once_per_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = tmp_path / "first.env"
+    first.write_text("BRIDGE_TEST_ENV_VALUE=first\n", encoding="utf-8")
+    second = tmp_path / "second.env"
+    second.write_text("BRIDGE_TEST_ENV_OTHER=second\n", encoding="utf-8")
+    monkeypatch.setattr(env, "_env_loaded", False)
+    # setenv first so teardown removes the keys load_env exports, even when
+    # they were absent before the test.
+    for name in ("BRIDGE_TEST_ENV_VALUE", "BRIDGE_TEST_ENV_OTHER"):
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+    before = set(os.environ)
+
+    env.load_env(dotenv_path=first)
+    env.load_env(dotenv_path=second)
+
+    assert os.environ["BRIDGE_TEST_ENV_VALUE"] == "first"
+    assert "BRIDGE_TEST_ENV_OTHER" not in os.environ
+    # Nothing besides the file's own keys is exported, so child processes
+    # started elsewhere still load their own ``.env``.
+    assert set(os.environ) - before == {"BRIDGE_TEST_ENV_VALUE"}
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from bridge.utils.hex import int_to_hex, parse_hex
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("0x1000", 0x1000),
+        ("0X1000", 0x1000),
+        ("1000", 0x1000),
+        ("  0xdeadBEEF\n", 0xDEADBEEF),
+    ],
+)
+def test_parse_hex_accepts_prefixed_and_bare_values(text: str, expected: int) -> None:
+    assert parse_hex(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "0x", "xyz", "0x10 20"])
+def test_parse_hex_rejects_malformed_values(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_hex(text)
+
+
+def test_int_to_hex_round_trips() -> None:
+    assert parse_hex(int_to_hex(0x400)) == 0x400
+
+
+def test_parse_hex_rejects_non_string_values() -> None:
+    # Only hex strings are accepted; an int is not treated as an address.
+    with pytest.raises(TypeError):
+        parse_hex(0x1000)  # type: ignore[arg-type]
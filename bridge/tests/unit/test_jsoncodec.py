@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from starlette.responses import JSONResponse
+
+from bridge.utils import jsoncodec
+
+
+def test_dumps_matches_starlette_rendering() -> None:
+    payload = {"ok": True, "data": {"name": "fünf", "items": [1, 2.5, None]}, "errors": ()}
+
+    assert jsoncodec.dumps(payload) == JSONResponse(payload).body
+
+
+def test_loads_accepts_bytes_and_raises_json_decode_error() -> None:
+    assert jsoncodec.loads(b'{"address": "0x1000"}') == {"address": "0x1000"}
+
+    with pytest.raises(json.JSONDecodeError):
+        jsoncodec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_loads_rejects_deeply_nested_input(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if backend == "json":
+        monkeypatch.setattr(jsoncodec, "orjson", None)
+    elif jsoncodec.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    with pytest.raises(json.JSONDecodeError):
+        jsoncodec.loads(b"[" * 200_000 + b"]" * 200_000)
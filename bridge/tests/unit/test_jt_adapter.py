@@ -155,6 +155,30 @@ def test_slot_check_thumb_candidate_verified(adapter: ARMThumbAdapter) -> None:
     assert client.function_calls == [thumb_ptr, real_target]
 
 
+def test_slot_check_odd_pointer_at_code_min_probes_arm_only(adapter: ARMThumbAdapter) -> None:
+    jt_base = 0x2000
+    addr = _slot_addr(jt_base, 4)
+    code_min = 0x2601
+    client = StubGhidraClient(
+        dwords={addr: code_min},
+        disassembly={code_min - 1: ["push {r4, lr}"]},
+        functions={code_min - 1: {"entry_point": code_min - 1, "name": "below_range"}},
+    )
+
+    result = slot_check(
+        client,
+        jt_base=jt_base,
+        slot_index=4,
+        code_min=code_min,
+        code_max=0x3000,
+        adapter=adapter,
+    )
+
+    assert result["mode"] == "none"
+    assert client.disassemble_calls == [code_min]
+    assert client.function_calls == [code_min]
+
+
 def test_slot_check_accepts_lower_bound(adapter: ARMThumbAdapter) -> None:
     jt_base = 0x2000
     addr = _slot_addr(jt_base, 5)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from bridge.api.routes._router import LiteralRouter
+
+
+def _endpoint(text: str):
+    async def handler(_: Request) -> PlainTextResponse:
+        return PlainTextResponse(text)
+
+    return handler
+
+
+def _app() -> Starlette:
+    app = Starlette()
+    app.router = LiteralRouter()
+    app.router.routes.extend(
+        [
+            Route("/api/a.json", _endpoint("a-get"), methods=["GET"]),
+            Route("/api/a.json", _endpoint("a-post"), methods=["POST"]),
+        ]
+    )
+    return app
+
+
+def test_literal_paths_dispatch_by_method() -> None:
+    with TestClient(_app()) as client:
+        assert client.get("/api/a.json").text == "a-get"
+        assert client.post("/api/a.json").text == "a-post"
+
+
+def test_fallback_keeps_405_and_404() -> None:
+    with TestClient(_app()) as client:
+        assert client.put("/api/a.json").status_code == 405
+        assert client.get("/api/missing.json").status_code == 404
+
+
+def test_routes_added_later_are_indexed() -> None:
+    app = _app()
+    with TestClient(app) as client:
+        assert client.get("/late").status_code == 404
+        app.router.routes.append(Route("/late", _endpoint("late"), methods=["GET"]))
+        assert client.get("/late").text == "late"
+
+
+def test_replaced_routes_are_reindexed() -> None:
+    app = _app()
+    with TestClient(app) as client:
+        assert client.get("/api/a.json").text == "a-get"
+        app.router.routes[0] = Route("/api/a.json", _endpoint("a-new"), methods=["GET"])
+        assert client.get("/api/a.json").text == "a-new"
+
+
+def test_routers_do_not_share_an_index() -> None:
+    first, second = LiteralRouter(), LiteralRouter()
+    first.routes.append(Route("/only-first", _endpoint("first"), methods=["GET"]))
+    assert "/only-first" in first._literal_index()
+    assert second._literal_index() == {}
+
+
+def test_parameterised_route_ends_literal_index() -> None:
+    app = _app()
+    app.router.routes.insert(0, Route("/api/{name}", _endpoint("param"), methods=["GET"]))
+    with TestClient(app) as client:
+        # Ordered matching still wins: the parameterised route comes first.
+        assert client.get("/api/a.json").text == "param"
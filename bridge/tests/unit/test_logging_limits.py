@@ -40,3 +40,20 @@ def test_enforce_batch_limit_enforces_limit():
         enforce_batch_limit(3)
         with pytest.raises(SafetyLimitExceeded):
             enforce_batch_limit(4)
+
+
+def test_debug_records_only_emitted_when_enabled(caplog):
+    logger = logging.getLogger("test.logger.debug")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with request_scope("quiet", logger=logger):
+            increment_counter("example")
+    assert not [r for r in caplog.records if r.levelno == logging.DEBUG]
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        with request_scope("verbose", logger=logger):
+            increment_counter("example")
+    messages = [r.getMessage() for r in caplog.records if r.levelno == logging.DEBUG]
+    assert "counter.example" in messages
+    assert "verbose.duration" in messages
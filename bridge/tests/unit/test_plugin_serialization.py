@@ -74,3 +74,48 @@ async def _exercise_serialization(caplog: pytest.LogCaptureFixture) -> None:
 
 def test_plugin_calls_are_serialized(caplog: pytest.LogCaptureFixture) -> None:
     asyncio.run(_exercise_serialization(caplog))
+
+
+async def _exercise_cached_health(*, status: int = 200, concurrent: bool = False) -> int:
+    probes = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal probes
+        probes += 1
+        return httpx.Response(status, text="ok\n")
+
+    mock_transport = httpx.MockTransport(handler)
+
+    def factory() -> GhidraClient:
+        return GhidraClient("http://ghidra/", transport=mock_transport)
+
+    app = Starlette(routes=make_routes(factory))
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        if concurrent:
+            responses = await asyncio.gather(
+                *(client.get("/api/health.json") for _ in range(3))
+            )
+        else:
+            responses = [await client.get("/api/health.json") for _ in range(3)]
+        for response in responses:
+            assert response.json()["data"]["ghidra"]["reachable"] is (status == 200)
+
+    return probes
+
+
+def test_health_probe_reuses_result_within_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("bridge.utils.config.HEALTH_CACHE_MS", 60_000)
+    assert asyncio.run(_exercise_cached_health()) == 1
+
+
+def test_health_probe_coalesces_concurrent_cache_misses(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("bridge.utils.config.HEALTH_CACHE_MS", 60_000)
+    assert asyncio.run(_exercise_cached_health(concurrent=True)) == 1
+
+
+def test_health_probe_does_not_cache_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("bridge.utils.config.HEALTH_CACHE_MS", 60_000)
+    assert asyncio.run(_exercise_cached_health(status=503)) == 3
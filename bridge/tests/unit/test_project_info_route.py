@@ -141,7 +141,7 @@ def test_project_overview_schema_failure_returns_envelope(monkeypatch) -> None:
 
     monkeypatch.setattr(
         project_routes,
-        "validate_payload",
+        "validate_response",
         lambda schema, payload: (False, ["invalid schema"]),
     )
 
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from bridge.api import validators
+from bridge.api._shared import envelope_error, envelope_ok
+from bridge.api.validators import validate_payload, validate_response
+from bridge.utils import config
+from bridge.utils.errors import ErrorCode
+
+
+def test_valid_payload_passes_without_mutation() -> None:
+    # The schema declares a default for include_literals; it must not be injected.
+    payload = {"address": "0x1000", "length": 16}
+    original = copy.deepcopy(payload)
+
+    assert validate_payload("read_bytes.request.v1.json", payload) == (True, [])
+    assert payload == original
+
+
+def test_invalid_payload_reports_every_error() -> None:
+    valid, errors = validate_payload(
+        "jt_slot_check.request.v1.json",
+        {"jt_base": "0x1000", "slot_index": -1, "code_min": "nope"},
+    )
+
+    assert not valid
+    assert len(errors) >= 3
+
+
+def test_validate_response_can_be_disabled(monkeypatch) -> None:
+    invalid = {"slot": "not-an-int"}
+    assert validate_response("jt_slot_check.v1.json", invalid)[0] is False
+
+    monkeypatch.setattr(config, "VALIDATE_RESPONSES", False)
+    assert validate_response("jt_slot_check.v1.json", invalid) == (True, [])
+
+
+def test_warm_validators_compiles_every_schema() -> None:
+    validators.warm_validators()
+
+    assert validators._load_schema.cache_info().currsize >= len(validators._schemas_by_id())
+    assert validators._compiled_schema.cache_info().currsize == (
+        validators._load_schema.cache_info().currsize
+    )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        envelope_ok({"value": 1}),
+        envelope_error(ErrorCode.INVALID_REQUEST, "bad input"),
+        {"ok": True, "data": [], "errors": []},
+        {"ok": "yes", "data": None, "errors": []},
+    ],
+)
+def test_validator_backends_agree_on_envelopes(payload) -> None:
+    compiled = validators._compiled_schema("envelope.v1.json")
+    if compiled is None:
+        pytest.skip("fastjsonschema is not installed")
+    try:
+        compiled(payload)
+    except validators.fastjsonschema.JsonSchemaException:
+        fast_valid = False
+    else:
+        fast_valid = True
+
+    assert fast_valid is validators._load_schema("envelope.v1.json").is_valid(payload)
+
+
+def test_success_envelope_passes_jsonschema_alone() -> None:
+    assert validators._load_schema("envelope.v1.json").is_valid(envelope_ok({"value": 1}))
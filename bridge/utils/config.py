@@ -36,6 +36,15 @@ MAX_ITEMS_PER_BATCH: Final[int] = _env_int("GHIDRA_MCP_MAX_ITEMS_PER_BATCH", def
 ENABLE_PROJECT_REBASE: Final[bool] = _env_bool(
     "GHIDRA_MCP_ENABLE_PROJECT_REBASE", default=False
 )
+# Response payloads are built by the bridge itself; checking them against their
+# schema is a development aid, so it follows ``__debug__`` unless overridden.
+VALIDATE_RESPONSES: Final[bool] = _env_bool(
+    "GHIDRA_MCP_VALIDATE_RESPONSES", default=__debug__
+)
+# Load balancers can poll /api/health.json many times a second; a positive TTL
+# lets repeat polls reuse the last upstream probe instead of taking the plugin
+# call slot each time.
+HEALTH_CACHE_MS: Final[int] = _env_int("GHIDRA_MCP_HEALTH_CACHE_MS", default=0)
 
 _audit_log_env = os.getenv("GHIDRA_MCP_AUDIT_LOG", "").strip()
 AUDIT_LOG_PATH: Final[Optional[Path]] = (
@@ -47,6 +56,8 @@ __all__ = [
     "AUDIT_LOG_PATH",
     "ENABLE_WRITES",
     "ENABLE_PROJECT_REBASE",
+    "HEALTH_CACHE_MS",
     "MAX_ITEMS_PER_BATCH",
     "MAX_WRITES_PER_REQUEST",
+    "VALIDATE_RESPONSES",
 ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence
 
 
@@ -80,6 +81,11 @@ _TEMPLATES: Mapping[ErrorCode, ErrorTemplate] = {
 }
 
 
+CODE_TO_STATUS: Mapping[ErrorCode, int] = MappingProxyType(
+    {code: template.status for code, template in _TEMPLATES.items()}
+)
+
+
 class DetailCode(str, Enum):
     """Error codes embedded in result items for legacy compatibility."""
 
@@ -122,4 +128,4 @@ def make_error(
     return dict(payload)
 
 
-__all__ = ["ErrorCode", "DetailCode", "ErrorTemplate", "make_error"]
+__all__ = ["CODE_TO_STATUS", "ErrorCode", "DetailCode", "ErrorTemplate", "make_error"]
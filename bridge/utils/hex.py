@@ -13,9 +13,7 @@ def int_to_hex(value: int) -> str:
 def parse_hex(value: str) -> int:
     """Parse a hex string into an integer."""
 
-    value = value.strip()
-    if value.lower().startswith("0x"):
-        return int(value, 16)
+    # ``int`` already skips surrounding whitespace and an optional 0x prefix.
     return int(value, 16)
 
 
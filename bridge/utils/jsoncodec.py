@@ -0,0 +1,49 @@
+"""JSON encode/decode helpers backed by ``orjson``.
+
+``orjson`` is pinned in ``requirements.txt``; the stdlib ``json`` fallback keeps
+the bridge working, with the same output, in environments that lack it.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is pinned; json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from raw request bytes without an intermediate ``str``.
+
+    Decode failures raise :class:`json.JSONDecodeError` (``orjson``'s error type
+    subclasses it), so existing handlers keep working. That includes bodies
+    nested deeper than the decoder's recursion limit.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except RecursionError:
+        raise json.JSONDecodeError("Recursion limit reached", "", 0) from None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON, matching Starlette's output."""
+
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+__all__ = ["HAS_ORJSON", "dumps", "loads"]
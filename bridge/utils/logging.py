@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -42,8 +43,9 @@ def scoped_timer(
     try:
         yield
     finally:
-        elapsed = monotonic() - start
-        logger.debug("%s", message, extra={"duration_s": elapsed, **(extra or {})})
+        if logger.isEnabledFor(logging.DEBUG):
+            elapsed = monotonic() - start
+            logger.debug("%s", message, extra={"duration_s": elapsed, **(extra or {})})
 
 
 class SafetyLimitExceeded(RuntimeError):
@@ -68,6 +70,10 @@ class RequestContext:
     metadata: Dict[str, object] = field(default_factory=dict)
     counters: Dict[str, int] = field(default_factory=dict)
     start_time: float = field(default_factory=monotonic)
+    # Collect runs projects on worker threads that share this context.
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def extra(self, **values: object) -> Dict[str, object]:
         payload = {"request_id": self.request_id, "request": self.name, **self.metadata}
@@ -81,11 +87,14 @@ class RequestContext:
         self.logger.log(level, message, extra=payload)
 
     def increment(self, counter: str, amount: int = 1) -> int:
-        value = self.counters.get(counter, 0) + amount
-        self.counters[counter] = value
-        self.logger.debug(
-            "counter.%s", counter, extra=self.extra(counter=counter, value=value)
-        )
+        with self._lock:
+            value = self.counters.get(counter, 0) + amount
+            self.counters[counter] = value
+        # Counters tick several times per request; skip the extra dict unless logged.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "counter.%s", counter, extra=self.extra(counter=counter, value=value)
+            )
         return value
 
 
@@ -112,7 +121,10 @@ def request_scope(
     token = _REQUEST_CONTEXT.set(context)
     context.log(logging.INFO, "request.start")
     try:
-        with scoped_timer(logger, f"{name}.duration", extra=context.extra(event="timer")):
+        timer_extra = (
+            context.extra(event="timer") if logger.isEnabledFor(logging.DEBUG) else None
+        )
+        with scoped_timer(logger, f"{name}.duration", extra=timer_extra):
             yield context
     except (ValueError, TypeError, json.JSONDecodeError) as exc:
         logger.debug(